@@ -61,21 +61,20 @@ def validate_environment():
     """Valida ambiente e dependências"""
     import sys
     import platform
+    from importlib.util import find_spec
     
     # Python version check
-    if sys.version_info < (3, 9):
-        raise RuntimeError(f"SEOFrog requires Python 3.9+, got {sys.version}")
+    if sys.version_info < (3, 11):
+        raise RuntimeError(f"SEOFrog requires Python 3.11+, got {sys.version}")
     
-    # Check critical dependencies
+    # Check critical dependencies (find_spec só localiza, não importa pandas/lxml)
     required_packages = [
         'requests', 'beautifulsoup4', 'lxml', 'pandas', 'urllib3'
     ]
     
     missing_packages = []
     for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
+        if find_spec(package) is None:
             missing_packages.append(package)
     
     if missing_packages:
@@ -1,4 +1,35 @@
-from .main import main
+"""
+seofrog/__main__.py
+Dispatcher leve do console script: só importa o subsistema pesado depois de decidir o comando
+"""
+
+import sys
+
+
+def main() -> int:
+    """Entry point do console script `seofrog`"""
+    argv = sys.argv[1:]
+    command = argv[0] if argv else None
+
+    # --version responde sem carregar CLI/crawler
+    if command == '--version':
+        from seofrog import __version__
+        print(f"SEOFrog v{__version__}")
+        return 0
+
+    # `seofrog analyze ARQUIVO` - mesmo que seofrog-analyze
+    if command == 'analyze':
+        from seofrog.analyzers.seo_analyzer import analyze_cli
+        sys.argv = [f"{sys.argv[0]} analyze"] + argv[1:]
+        return analyze_cli()
+
+    # `seofrog crawl URL` é aceito como alias de `seofrog URL`
+    if command == 'crawl':
+        sys.argv = [sys.argv[0]] + argv[1:]
+
+    from seofrog.main import main as crawl_main
+    return crawl_main()
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
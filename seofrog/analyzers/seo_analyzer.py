@@ -248,8 +248,8 @@ def print_analysis_report(results: Dict[str, Any]):
     print("\n" + "=" * 50)
     print("✅ Análise concluída!")
 
-def analyze_cli():
-    """Entry point para linha de comando de análise"""
+def analyze_cli() -> int:
+    """Entry point para linha de comando de análise (retorna o exit code)"""
     import argparse
     
     parser = argparse.ArgumentParser(description='Analisador de resultados SEOFrog')
@@ -261,7 +261,9 @@ def analyze_cli():
         analyze_crawl_results(args.file)
     except Exception as e:
         print(f"❌ Erro: {e}")
-        sys.exit(1)
+        return 1
+    
+    return 0
 
 if __name__ == "__main__":
-    analyze_cli()
\ No newline at end of file
+    sys.exit(analyze_cli())
\ No newline at end of file
@@ -5,6 +5,7 @@ Core Engine Principal do SEOFrog v0.2 Enterprise - ATUALIZADO PARA PARSERS MODUL
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urljoin, urlparse, urlunparse, parse_qs, urlencode, unquote
 from urllib.robotparser import RobotFileParser
 import xml.etree.ElementTree as ET
@@ -31,7 +32,7 @@ from seofrog.utils.logger import get_logger, CrawlProgressLogger
 
 # 🔥 PARSERS MODULARES - REMOVIDO SEOParser
 from seofrog.parsers.meta_parser import MetaParser
-from seofrog.parsers.technical_parser import TechnicalParser
+from seofrog.parsers.technical_parser import TechnicalParser, RedirectChecker
 from seofrog.parsers.social_parser import SocialParser
 from seofrog.parsers.schema_parser import SchemaParser
 
@@ -141,6 +142,11 @@ class HTTPEngine:
         self.config = config
         self.session = requests.Session()
         
+        # Pool keep-alive dimensionado pelos workers (o default de 10 descarta conexões acima disso)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max(10, config.max_workers), max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
         # Desabilita verificação SSL para sites com problemas de certificado
         self.session.verify = False
         # Suprime warnings de SSL
@@ -506,6 +512,11 @@ class SEOFrog:
         self.crawl_queue = deque()
         self.results = []
         self.crawled_count = 0
+        
+        # Links internos por página aguardando a verificação de redirects em lote
+        # (strings compartilhadas: links de menu/rodapé se repetem em todas as páginas)
+        self._redirect_check_pages = {}
+        self._redirect_link_pool = {}
         self.start_time = None
         self.should_stop = False
         
@@ -669,7 +680,7 @@ class SEOFrog:
             
             # Descobre novos links se dentro da profundidade
             if depth < self.config.max_depth and response.status_code == 200:
-                self._discover_links(url, response, depth)
+                self._discover_links(url, soup, depth)
             
             # Delay entre requests
             if self.config.delay > 0:
@@ -781,15 +792,11 @@ class SEOFrog:
         else:
             return 'other'
     
-    def _discover_links(self, url: str, response: requests.Response, current_depth: int):
-        """Descobre novos links para crawling"""
+    def _discover_links(self, url: str, soup: BeautifulSoup, current_depth: int):
+        """Descobre novos links para crawling (reusa o soup já parseado em crawl_url)"""
         try:
-            content_type = response.headers.get('content-type', '').lower()
-            if 'text/html' not in content_type:
-                return
-            
-            soup = BeautifulSoup(response.content, 'lxml')
             links = soup.find_all('a', href=True)
+            base_netloc = urlparse(url).netloc
             
             new_urls = []
             for link in links:
@@ -801,7 +808,7 @@ class SEOFrog:
                 parsed = urlparse(full_url)
                 
                 # Só URLs do mesmo domínio
-                if parsed.netloc != urlparse(url).netloc:
+                if parsed.netloc != base_netloc:
                     continue
                 
                 # Verifica se é uma URL válida para crawl
@@ -897,8 +904,12 @@ class SEOFrog:
                         try:
                             result = future.result()
                             if result:
+                                links = result.pop('_internal_links_for_redirect_check', None)
                                 with self.results_lock:
                                     self.results.append(result)
+                                    if links is not None:
+                                        pool = self._redirect_link_pool
+                                        self._redirect_check_pages[result['url']] = tuple(pool.setdefault(link, link) for link in links)
                                 
                                 # Log progresso
                                 if len(self.results) % 50 == 0:
@@ -914,6 +925,9 @@ class SEOFrog:
                 # Pequeno delay para evitar busy waiting
                 time.sleep(0.1)
         
+        # Verificação de redirects dos links internos (em lote, após o crawl)
+        self._check_internal_redirects()
+        
         # Finaliza crawl
         elapsed = (datetime.now() - self.start_time).total_seconds()
         success_count = len([r for r in self.results if r.get('status_code', 0) == 200])
@@ -924,6 +938,35 @@ class SEOFrog:
         
         return self.results
     
+    def _check_internal_redirects(self):
+        """Verifica em lote os redirects dos links internos coletados pelo TechnicalParser"""
+        pages = self._redirect_check_pages
+        self._redirect_check_pages = {}
+        self._redirect_link_pool = {}
+        
+        if not pages:
+            return
+        
+        redirect_data_by_page = {}
+        if self.should_stop:
+            self.logger.info("⚠️ Crawl interrompido: verificação de redirects em lote ignorada")
+        else:
+            try:
+                checker = RedirectChecker(self.technical_parser, max_workers=self.config.max_workers,
+                                          should_stop=lambda: self.should_stop)
+                redirect_data_by_page = checker.apply(pages, checker.run(pages))
+            except Exception as e:
+                self.logger.error(f"Erro na verificação de redirects em lote: {e}")
+        
+        # Páginas sem resultado (interrompido/falha) recebem os campos padrão
+        for result in self.results:
+            url = result['url']
+            if url in pages:
+                redirect_data = redirect_data_by_page.get(url)
+                if redirect_data is None:
+                    redirect_data = self.technical_parser.build_redirect_data(url, [], {})
+                result.update(redirect_data)
+    
     def export_results(self, format: str = 'xlsx', filename: str = None) -> str:
         """Exporta resultados do crawl"""
         if format.lower() == 'csv':
@@ -10,6 +10,12 @@ try:
     import openpyxl
     from openpyxl.styles import Font, PatternFill, Alignment
     OPENPYXL_AVAILABLE = True
+    
+    # Estilos imutáveis do openpyxl: criados uma vez e compartilhados por todas as células
+    _HEADER_FONT = Font(bold=True, color="FFFFFF", size=11)
+    _HEADER_FILL = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+    _HEADER_ALIGNMENT = Alignment(horizontal="center", vertical="center", wrap_text=True)
+    _DATA_ALIGNMENT = Alignment(horizontal="left", vertical="top", wrap_text=False)
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
@@ -61,17 +67,9 @@ class ExcelWriter:
             if worksheet.max_row > 0:
                 for cell in worksheet[1]:
                     if cell.value:  # Só formata células com conteúdo
-                        cell.font = Font(bold=True, color="FFFFFF", size=11)
-                        cell.fill = PatternFill(
-                            start_color="366092", 
-                            end_color="366092", 
-                            fill_type="solid"
-                        )
-                        cell.alignment = Alignment(
-                            horizontal="center", 
-                            vertical="center",
-                            wrap_text=True
-                        )
+                        cell.font = _HEADER_FONT
+                        cell.fill = _HEADER_FILL
+                        cell.alignment = _HEADER_ALIGNMENT
             
             # === AUTO-AJUSTE DE COLUNAS ===
             for column in worksheet.columns:
@@ -99,11 +97,7 @@ class ExcelWriter:
                 for row in worksheet.iter_rows(min_row=2):
                     for cell in row:
                         if cell.value:
-                            cell.alignment = Alignment(
-                                horizontal="left", 
-                                vertical="top",
-                                wrap_text=False
-                            )
+                            cell.alignment = _DATA_ALIGNMENT
             
         except Exception as e:
             self.logger.warning(f"Erro formatando worksheet: {e}")
@@ -15,7 +15,6 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from .cli import parse_cli_args, get_config_for_seofrog
 from seofrog.utils.logger import setup_logging, get_logger, CrawlProgressLogger
 from seofrog.core.exceptions import SEOFrogException, ConfigException
-from seofrog.analyzers.seo_analyzer import analyze_crawl_results
 
 def print_banner():
     """Banner do SEOFrog"""
@@ -35,8 +34,8 @@ def validate_system_requirements():
         import psutil
         
         # Verifica Python version
-        if sys.version_info < (3, 9):
-            raise SystemError("SEOFrog requer Python 3.9 ou superior")
+        if sys.version_info < (3, 11):
+            raise SystemError("SEOFrog requer Python 3.11 ou superior")
         
         # Verifica memória disponível
         memory_gb = psutil.virtual_memory().total / (1024**3)
@@ -63,6 +62,9 @@ def handle_analyze_mode(analyze_file: str) -> int:
             return 1
         
         logger.info(f"📊 Analisando arquivo: {analyze_file}")
+        
+        # Importa analyzer (pandas) só quando necessário
+        from seofrog.analyzers.seo_analyzer import analyze_crawl_results
         analyze_crawl_results(analyze_file)
         logger.info("✅ Análise concluída")
         return 0
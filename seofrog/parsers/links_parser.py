@@ -3,15 +3,32 @@ PATCH 1: seofrog/parsers/links_parser.py
 Corrige estrutura de dados para redirects por URL
 """
 
+import atexit
 import re
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse, urljoin, urlunparse
 from typing import Dict, Any, List, Optional
 from collections import defaultdict
 from bs4 import BeautifulSoup, Tag
 from seofrog.parsers.base import ParserMixin, SeverityLevel
 
+
+def _build_http_session() -> requests.Session:
+    """Sessão HTTP dos HEADs de redirect (keep-alive + pool de conexões por host)"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+# Compartilhada por todas as instâncias, com um único hook de atexit no processo
+_HTTP_SESSION = _build_http_session()
+atexit.register(_HTTP_SESSION.close)
+
+
 class LinksParser(ParserMixin):
     """
     Parser especializado para análise completa de links
@@ -26,6 +43,9 @@ class LinksParser(ParserMixin):
         self.redirect_timeout = redirect_timeout
         self.redirect_rate_limit = 0.1  # 100ms entre requests
 
+        # Sessão HTTP compartilhada: HEADs de links do mesmo host aproveitam keep-alive
+        self._http = _HTTP_SESSION
+
         # Configurações de qualidade
         self.ideal_internal_links_ratio = 0.8  # 80% links internos
         self.max_links_per_100_words = 10
@@ -187,7 +207,7 @@ class LinksParser(ParserMixin):
         Resolve redirect com timeout e tratamento de erro melhorado
         """
         try:
-            response = requests.head(
+            response = self._http.head(
                 url, 
                 allow_redirects=True, 
                 timeout=self.redirect_timeout,
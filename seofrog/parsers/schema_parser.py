@@ -10,6 +10,23 @@ from typing import Dict, Any, List, Optional, Set
 from bs4 import BeautifulSoup, Tag
 from .base import ParserMixin, SeverityLevel
 
+# Imports de dependências opcionais
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _loads_json_ld(text: str) -> Any:
+    """json.loads acelerado por orjson; erros caem no json padrão (mesma semântica/mensagem)"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
 class SchemaParser(ParserMixin):
     """
     Parser especializado para análise completa de Structured Data
@@ -115,7 +132,7 @@ class SchemaParser(ParserMixin):
             
             try:
                 # Parse JSON
-                schema_data = json.loads(script_text)
+                schema_data = _loads_json_ld(script_text)
                 
                 # Analisa o schema parseado
                 schema_info = self._analyze_json_ld_schema(schema_data, i + 1)
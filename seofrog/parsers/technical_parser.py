@@ -5,21 +5,173 @@ Responsável por: viewport, charset, favicon, AMP, lang, DOCTYPE, performance hi
 """
 
 import re
+import atexit
 import requests
 import time
+import threading
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse, urljoin
-from typing import Dict, Any, List, Optional, Set
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Any, List, Optional, Set, Tuple
 from bs4 import BeautifulSoup, Tag, Doctype
+from operator import itemgetter
 from .base import ParserMixin, SeverityLevel
+from seofrog.utils.logger import get_logger
+
+# Valores padrão dos flags usados nos scores (aplicados uma vez antes das análises)
+_SCORING_DEFAULTS = {
+    'doctype_valid': False,
+    'has_html_lang': False,
+    'html_lang_valid': False,
+    'charset_is_utf8': False,
+    'charset_early_declaration': False,
+    'has_viewport': False,
+    'viewport_mobile_optimized': False,
+    'has_favicon': False,
+    'favicon_has_apple_touch': False,
+    'html_structure_valid': False,
+    'robots_allows_indexing': True,
+    'has_meta_refresh': False,
+    'uses_dns_prefetch': False,
+    'uses_preconnect': False,
+    'uses_preload': False
+}
+
+# Fatores de cada score (has_meta_refresh entra negado, somado à parte)
+_QUALITY_KEYS = ('doctype_valid', 'has_html_lang', 'charset_is_utf8', 'has_viewport',
+                 'has_favicon', 'html_structure_valid', 'robots_allows_indexing')
+_MOBILE_KEYS = ('has_viewport', 'viewport_mobile_optimized', 'favicon_has_apple_touch', 'html_lang_valid')
+_PERFORMANCE_KEYS = ('charset_early_declaration', 'uses_dns_prefetch', 'uses_preconnect', 'uses_preload')
+_BEST_PRACTICES_KEYS = ('uses_html5', 'valid_html_structure', 'has_proper_charset', 'has_language_declaration',
+                        'mobile_viewport', 'mobile_optimized_viewport', 'has_favicon', 'indexing_allowed',
+                        'no_meta_refresh', 'no_critical_technical_issues')
+
+_QUALITY_GETTER = itemgetter(*_QUALITY_KEYS)
+_MOBILE_GETTER = itemgetter(*_MOBILE_KEYS)
+_PERFORMANCE_GETTER = itemgetter(*_PERFORMANCE_KEYS)
+_BEST_PRACTICES_GETTER = itemgetter(*_BEST_PRACTICES_KEYS)
+
+
+def _score_table(total_factors: int) -> Tuple[int, ...]:
+    """
+    Tabela score (0-100) indexada pelo número de fatores atendidos
+    Mesmo arredondamento de int((n / total) * 100), sem divisão float por página
+    """
+    return tuple(int((count / total_factors) * 100) for count in range(total_factors + 1))
+
+
+_QUALITY_SCORES = _score_table(len(_QUALITY_KEYS) + 1)
+_MOBILE_SCORES = _score_table(len(_MOBILE_KEYS))
+_PERFORMANCE_SCORES = _score_table(len(_PERFORMANCE_KEYS) + 1)
+_FAVICON_COVERAGE_SCORES = _score_table(5)
+
+
+# Regras de detecção de issues técnicas, na ordem do relatório:
+# (chave, valor esperado, issue se diferente, chave de validação, issue se inválido)
+_ISSUE_RULES = (
+    # Problemas críticos
+    ('has_doctype', True, 'doctype_ausente', 'doctype_valid', 'doctype_invalido'),
+    ('has_charset', True, 'charset_ausente', 'charset_is_utf8', 'charset_nao_utf8'),
+    # Problemas de mobile
+    ('has_viewport', True, 'viewport_ausente', 'viewport_mobile_optimized', 'viewport_nao_otimizado'),
+    # Problemas de estrutura
+    ('html_structure_valid', True, 'estrutura_html_invalida', None, None),
+    ('has_html_lang', True, 'lang_ausente', 'html_lang_valid', 'lang_invalido'),
+    # Problemas de SEO
+    ('robots_noindex', False, 'pagina_bloqueada_indexacao', None, None),
+    ('has_meta_refresh', False, 'meta_refresh_presente', None, None),
+    # Problemas de performance
+    ('charset_early_declaration', True, 'charset_declaracao_tardia', None, None),
+)
+
+# Issues que marcam a página com problema crítico no resumo
+_CRITICAL_ISSUES = frozenset({'doctype_ausente', 'charset_ausente', 'viewport_ausente'})
+
+# Issue técnica -> chave de severity (demais issues: 'tecnico_nao_otimizado')
+_ISSUE_TO_SEVERITY = {
+    'doctype_ausente': 'html_estrutura_critica',
+    'charset_ausente': 'html_estrutura_critica',
+    'estrutura_html_invalida': 'html_estrutura_critica',
+    'viewport_ausente': 'mobile_nao_otimizado',
+    'viewport_nao_otimizado': 'mobile_nao_otimizado',
+    'pagina_bloqueada_indexacao': 'seo_tecnico_problematico',
+    'meta_refresh_presente': 'seo_tecnico_problematico',
+}
+
+
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    """
+    Extrai o netloc (minúsculo) de uma URL absoluta
+    Para http/https corta a string diretamente; demais esquemas usam urlparse
+    """
+    if url.startswith(('http://', 'https://')):
+        rest = url.split('://', 1)[1]
+        end = len(rest)
+        for sep in '/?#':
+            pos = rest.find(sep)
+            if pos != -1 and pos < end:
+                end = pos
+        return rest[:end].lower()
+    return urlparse(url).netloc.lower()
+
+
+def _build_redirect_session() -> requests.Session:
+    """Sessão HTTP da detecção de redirects (keep-alive + pool de conexões por host)"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({'User-Agent': 'SEOFrog/1.0 (Redirect Detection)'})
+    return session
+
+
+# Uma sessão por processo, compartilhada por todas as instâncias do parser:
+# um único hook de atexit, sem prender uma sessão por instância criada
+_REDIRECT_SESSION = _build_redirect_session()
+atexit.register(_REDIRECT_SESSION.close)
+
 
 class TechnicalParser(ParserMixin):
     """
     Parser especializado para análise completa de elementos técnicos SEO
     Responsável por: viewport, charset, favicon, AMP, lang, DOCTYPE, performance, security
     """
+
+    # Regex pré-compiladas (evita recompilar/consultar cache do re a cada página)
+    _RE_CHARSET_IN_CONTENT = re.compile(r'charset=([^;]+)', re.I)
+    _RE_VIEWPORT_TOKENS = re.compile(r'(?<![\w-])(width|initial-scale|maximum-scale|user-scalable)\s*=\s*([^,;\s]+)')
+    _RE_SCALE_VALUE = re.compile(r'[0-9.]+')
+    _RE_ICON_REL = re.compile(r'icon|shortcut|apple-touch', re.I)
+    _RE_AMPPROJECT = re.compile(r'ampproject\.org', re.I)
+    _RE_V0JS = re.compile(r'v0\.js', re.I)
+
+    # Extensão do href → formato do favicon
+    _EXT_MAP = {'.ico': 'ico', '.png': 'png', '.svg': 'svg', '.gif': 'gif'}
+
+    # Tags indexadas por _scan_tags em uma única passada pelo documento
+    _INDEXED_TAGS = ('meta', 'link', 'script')
+
+    # Delay inicial do content do meta refresh
+    _RE_REFRESH_DELAY = re.compile(r'^\s*(\d+)')
+
+    # Assets estáticos: não vale um HEAD para checar redirect (tupla para str.endswith)
+    _SKIP_EXT = (
+        '.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.ico', '.pdf', '.zip',
+        '.mp4', '.css', '.js', '.woff', '.woff2', '.ttf'
+    )
     
-    def __init__(self):
+    def __init__(self, verbose_details: bool = False):
+        """
+        Args:
+            verbose_details: Se True, preenche favicon_details e performance_hints_details
+                             com um dict por <link>; caso contrário só os agregados
+        """
         super().__init__()
+
+        self.verbose_details = verbose_details
         
         # Viewports recomendados
         self.recommended_viewports = [
@@ -49,12 +201,15 @@ class TechnicalParser(ParserMixin):
         ]
         
         # Códigos de idioma válidos (amostra)
-        self.valid_lang_codes = {
+        self.valid_lang_codes = frozenset({
             'pt', 'pt-br', 'pt-pt', 'en', 'en-us', 'en-gb', 
             'es', 'es-es', 'es-mx', 'fr', 'fr-fr', 'de', 'de-de',
             'it', 'it-it', 'ja', 'ja-jp', 'ko', 'ko-kr', 'zh', 
             'zh-cn', 'zh-tw', 'ru', 'ru-ru', 'ar', 'ar-sa'
-        }
+        })
+
+        # Idiomas considerados genéricos demais (sem região)
+        self._generic_langs = frozenset({'en', 'pt', 'es'})
         
         # Meta robots válidos
         self.valid_robots_directives = [
@@ -62,19 +217,44 @@ class TechnicalParser(ParserMixin):
             'noarchive', 'snippet', 'nosnippet', 'imageindex', 
             'noimageindex', 'translate', 'notranslate', 'none', 'all'
         ]
+
+        # Versões normalizadas para lookup O(1) durante o parse
+        self._recommended_viewports_norm = frozenset(
+            viewport.replace(' ', '').lower() for viewport in self.recommended_viewports
+        )
+        self._valid_charsets_set = frozenset(self.valid_charsets)
+        self._valid_robots_set = frozenset(self.valid_robots_directives)
+
+        # Favicons se repetem em todas as páginas do site: valida cada href uma única vez
+        self._is_valid_url_cached = lru_cache(maxsize=1024)(self.is_valid_url)
+
+        # Cache LRU dos dados de favicon por origem
+        self.favicon_cache_size = 256
+        self._favicon_cache = OrderedDict()
+        self._favicon_cache_lock = threading.Lock()
         
         # 🆕 CONFIGURAÇÃO PARA DETECÇÃO DE REDIRECTS
         self.enable_redirect_detection = True
         self.redirect_timeout = 5
         self.redirect_delay = 0.05
         self.max_redirects_check = 100
-    
+
+        # Sessão HTTP compartilhada do módulo (keep-alive + pool de conexões por host)
+        self._http = _REDIRECT_SESSION
+
+        # Cache de resultados por URL: links de menu/rodapé se repetem em todas as páginas
+        # (só respostas obtidas; timeouts/erros de conexão são tentados de novo)
+        self.redirect_cache_size = 10_000
+        self._redirect_cache = OrderedDict()
+        self._redirect_cache_lock = threading.Lock()
+
     def parse(self, soup: BeautifulSoup, url: str = None) -> Dict[str, Any]:
         """
         Parse completo de análise de elementos técnicos
         
         Args:
-            soup: BeautifulSoup object da página
+            soup: BeautifulSoup object da página, construído com o parser 'lxml'
+                  (html.parser é várias vezes mais lento em todos os find/find_all)
             url: URL da página (para validação de links relativos)
             
         Returns:
@@ -83,24 +263,30 @@ class TechnicalParser(ParserMixin):
         data = {}
         
         try:
+            # Tags estruturais buscadas uma única vez e reaproveitadas
+            ctx = self._build_context(soup)
+
             # Parse de cada categoria técnica
-            self._parse_doctype(soup, data)
-            self._parse_html_lang(soup, data)
-            self._parse_charset(soup, data)
-            self._parse_viewport(soup, data)
-            self._parse_favicon(soup, data, url)
-            self._parse_amp_detection(soup, data)
-            self._parse_meta_robots_advanced(soup, data)
-            self._parse_performance_hints(soup, data, url)
-            self._parse_security_headers(soup, data)
-            self._parse_html_structure(soup, data)
-
-            # 🆕 DETECÇÃO DE REDIRECTS
+            self._parse_doctype(ctx, data)
+            self._parse_html_lang(ctx, data)
+            self._parse_charset(ctx, data)
+            self._parse_viewport(ctx, data)
+            self._parse_favicon(ctx, data, url)
+            self._parse_amp_detection(ctx, data)
+            self._parse_meta_robots_advanced(ctx, data)
+            self._parse_performance_hints(ctx, data, url)
+            self._parse_security_headers(ctx, data)
+            self._parse_html_structure(ctx, data)
+
+            # 🆕 DETECÇÃO DE REDIRECTS: só coleta os links; a verificação HTTP
+            # acontece em lote após o crawl (RedirectChecker)
             if url and self.enable_redirect_detection:
-                redirect_data = self.check_internal_redirects(soup, url)
-                data.update(redirect_data)
+                data['_internal_links_for_redirect_check'] = self._extract_internal_links(soup, url)[:self.max_redirects_check]
 
             # Análise de qualidade técnica
+            for key, default in _SCORING_DEFAULTS.items():
+                data.setdefault(key, default)
+
             self._analyze_technical_quality(data)
             self._analyze_mobile_optimization(data)
             self._analyze_performance_optimization(data)
@@ -122,78 +308,104 @@ class TechnicalParser(ParserMixin):
 
         return data
 
-    def check_internal_redirects(self, soup: BeautifulSoup, base_url: str) -> Dict[str, Any]:
-        """Detecta redirects em links internos da página"""
-        redirect_data = {
-            'redirects_found': [],
-            'redirects_count': 0,
-            'redirects_by_code': {},
-            'redirects_errors': []
-        }
+    def parse_html(self, html_content: Any, url: str = None) -> Dict[str, Any]:
+        """
+        Parse a partir do HTML bruto (str ou bytes), construindo o soup com lxml
+
+        Args:
+            html_content: HTML da página
+            url: URL da página
+
+        Returns:
+            Dict com dados completos de elementos técnicos
+        """
+        return self.parse(BeautifulSoup(html_content, 'lxml'), url)
 
+    def check_internal_redirects(self, soup: BeautifulSoup, base_url: str) -> Dict[str, Any]:
+        """
+        Detecta redirects em links internos da página (verificação serial, página a página)
+        No crawl completo use RedirectChecker, que verifica em lote após o crawl
+        """
         if not self.enable_redirect_detection:
-            return redirect_data
+            return self.build_redirect_data(base_url, [], {})
 
         try:
-            # Encontra todos os links internos
-            internal_links = self._extract_internal_links(soup, base_url)
+            # Encontra todos os links internos (limitados para não sobrecarregar)
+            links_to_check = self._extract_internal_links(soup, base_url)[:self.max_redirects_check]
 
-            if not internal_links:
-                return redirect_data
+            if links_to_check:
+                self.logger.info(f"🔄 Verificando redirects em {len(links_to_check)} links internos de {base_url}...")
 
-            # Limita quantidade para não sobrecarregar
-            links_to_check = internal_links[:self.max_redirects_check]
+            redirect_results = {}
+            for link_url in links_to_check:
+                redirect_results[link_url] = self._safe_check_redirect(link_url)
 
-            self.logger.info(f"🔄 Verificando redirects em {len(links_to_check)} links internos de {base_url}...")
+                # Rate limiting
+                time.sleep(self.redirect_delay)
 
-            for link_url in links_to_check:
-                try:
-                    redirect_info = self._check_single_redirect(link_url)
-
-                    if redirect_info['has_redirect']:
-                        redirect_data['redirects_found'].append({
-                            'source_url': base_url,
-                            'link_url': link_url,
-                            'final_url': redirect_info['final_url'],
-                            'status_code': redirect_info['status_code'],
-                            'redirect_chain': redirect_info.get('redirect_chain', [])
-                        })
-
-                        # Log do redirect encontrado
-                        self.logger.info(f"🔄 REDIRECT detectado: {link_url} → {redirect_info['final_url']} ({redirect_info['status_code']})")
-
-                    # Rate limiting
-                    time.sleep(self.redirect_delay)
-
-                except Exception as e:
-                    redirect_data['redirects_errors'].append({
-                        'url': link_url,
-                        'error': str(e)
-                    })
-
-            # Estatísticas finais
-            redirect_data['redirects_count'] = len(redirect_data['redirects_found'])
-
-            # Contagem por código de status
-            status_codes = {}
-            for redirect in redirect_data['redirects_found']:
-                code = redirect['status_code']
-                status_codes[code] = status_codes.get(code, 0) + 1
-            redirect_data['redirects_by_code'] = status_codes
-
-            if redirect_data['redirects_count'] > 0:
-                self.logger.info(f"✅ Encontrados {redirect_data['redirects_count']} redirects em {base_url}")
+            return self.build_redirect_data(base_url, links_to_check, redirect_results)
 
         except Exception as e:
             self.logger.error(f"Erro na detecção de redirects: {e}")
+            redirect_data = self.build_redirect_data(base_url, [], {})
             redirect_data['redirects_errors'].append({'error': str(e)})
+            return redirect_data
+
+    def build_redirect_data(self, base_url: str, links: List[str],
+                            redirect_results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Monta os campos de redirect de uma página a partir dos resultados por URL
+
+        Args:
+            base_url: URL da página de origem
+            links: Links internos da página que foram verificados
+            redirect_results: Mapa {url: redirect_info} (pode conter URLs de outras páginas)
+        """
+        redirect_data = {
+            'redirects_found': [],
+            'redirects_count': 0,
+            'redirects_by_code': {},
+            'redirects_errors': []
+        }
+
+        for link_url in links:
+            redirect_info = redirect_results.get(link_url)
+            if redirect_info is None:
+                continue
+
+            if 'exception' in redirect_info:
+                redirect_data['redirects_errors'].append({
+                    'url': link_url,
+                    'error': redirect_info['exception']
+                })
+            elif redirect_info['has_redirect']:
+                redirect_data['redirects_found'].append({
+                    'source_url': base_url,
+                    'link_url': link_url,
+                    'final_url': redirect_info['final_url'],
+                    'status_code': redirect_info['status_code'],
+                    'redirect_chain': redirect_info.get('redirect_chain', [])
+                })
+
+        # Estatísticas finais
+        redirect_data['redirects_count'] = len(redirect_data['redirects_found'])
+
+        # Contagem por código de status
+        status_codes = {}
+        for redirect in redirect_data['redirects_found']:
+            code = redirect['status_code']
+            status_codes[code] = status_codes.get(code, 0) + 1
+        redirect_data['redirects_by_code'] = status_codes
+
+        if redirect_data['redirects_count'] > 0:
+            self.logger.info(f"✅ Encontrados {redirect_data['redirects_count']} redirects em {base_url}")
 
         return redirect_data
 
     def _extract_internal_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """Extrai todos os links internos da página"""
-        base_domain = urlparse(base_url).netloc
-        internal_links = []
+        base_domain = _netloc(base_url)
+        internal_links = {}  # dict preserva a ordem do documento e remove duplicatas
 
         for link in soup.find_all('a', href=True):
             href = link.get('href', '').strip()
@@ -203,14 +415,31 @@ class TechnicalParser(ParserMixin):
 
             # Converte para URL absoluta
             absolute_url = urljoin(base_url, href)
-            parsed = urlparse(absolute_url)
-            
+
             # Só links do mesmo domínio
-            if parsed.netloc == base_domain:
-                internal_links.append(absolute_url)
+            if _netloc(absolute_url) != base_domain:
+                continue
+
+            # Ignora assets estáticos
+            path = absolute_url.split('#', 1)[0].split('?', 1)[0].lower()
+            if path.endswith(self._SKIP_EXT):
+                continue
 
-        # Remove duplicatas
-        return list(set(internal_links))
+            internal_links[absolute_url] = None
+
+        return list(internal_links)
+
+    def _safe_check_redirect(self, url: str) -> Dict[str, Any]:
+        """Verifica redirect de uma URL sem propagar exceções inesperadas"""
+        try:
+            redirect_info = self._check_single_redirect(url)
+        except Exception as e:
+            return {'has_redirect': False, 'exception': str(e)}
+
+        if redirect_info['has_redirect']:
+            self.logger.info(f"🔄 REDIRECT detectado: {url} → {redirect_info['final_url']} ({redirect_info['status_code']})")
+
+        return redirect_info
 
     def _check_single_redirect(self, url: str) -> Dict[str, Any]:
         """Verifica se uma URL específica tem redirect"""
@@ -221,30 +450,133 @@ class TechnicalParser(ParserMixin):
             'redirect_chain': []
         }
 
+        final_url, status_code, error = self._head_redirect_cached(url)
+
+        if error is not None:
+            redirect_info['error'] = error
+        else:
+            redirect_info['status_code'] = status_code
+            redirect_info['final_url'] = final_url
+
+            # Verifica se houve redirect (URL mudou)
+            if final_url != url:
+                redirect_info['has_redirect'] = True
+
+        return redirect_info
+
+    def _head_redirect_cached(self, url: str) -> Tuple[str, Optional[int], Optional[str]]:
+        """_head_redirect com cache LRU apenas dos resultados com status HTTP"""
+        with self._redirect_cache_lock:
+            cached = self._redirect_cache.get(url)
+            if cached is not None:
+                self._redirect_cache.move_to_end(url)
+                return cached
+
+        result = self._head_redirect(url)
+
+        if result[1] is not None:
+            with self._redirect_cache_lock:
+                self._redirect_cache[url] = result
+                if len(self._redirect_cache) > self.redirect_cache_size:
+                    self._redirect_cache.popitem(last=False)
+
+        return result
+
+    def _head_redirect(self, url: str) -> Tuple[str, Optional[int], Optional[str]]:
+        """
+        Faz HEAD request para verificar redirect sem baixar conteúdo
+
+        Returns:
+            Tupla (final_url, status_code, erro ou None)
+        """
         try:
-            # Faz HEAD request para verificar redirect sem baixar conteúdo
-            response = requests.head(
+            response = self._http.head(
                 url,
                 allow_redirects=True,
                 timeout=self.redirect_timeout,
-                headers={'User-Agent': 'SEOFrog/1.0 (Redirect Detection)'},
                 verify=False  # Ignora SSL como no crawler principal
             )
 
-            redirect_info['status_code'] = response.status_code
-            redirect_info['final_url'] = response.url
+            # Servidores que não aceitam HEAD: GET em stream (só cabeçalhos, sem corpo)
+            if response.status_code in (405, 501):
+                with self._http.get(
+                    url,
+                    allow_redirects=True,
+                    timeout=self.redirect_timeout,
+                    verify=False,
+                    stream=True
+                ) as response:
+                    return response.url, response.status_code, None
 
-            # Verifica se houve redirect (URL mudou)
-            if response.url != url:
-                redirect_info['has_redirect'] = True
+            return response.url, response.status_code, None
 
         except requests.RequestException as e:
             self.logger.debug(f"Erro verificando redirect {url}: {e}")
-            redirect_info['error'] = str(e)
+            return url, None, str(e)
 
-        return redirect_info
+    def _build_context(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """
+        Localiza DOCTYPE e tags estruturais (html/head/body/title) uma única vez
+        e indexa meta/link/script do documento todo
+        """
+        head = soup.find('head')
+        return {
+            'html': soup.find('html'),
+            'head': head,
+            'tag_index': self._scan_tags(soup, head),
+            'body': soup.find('body'),
+            'title': soup.find('title'),
+            'doctype': next((item for item in soup.contents if isinstance(item, Doctype)), None)
+        }
+
+    def _scan_tags(self, soup: BeautifulSoup, head: Optional[Tag] = None) -> Dict[str, Any]:
+        """
+        Percorre o documento uma única vez e indexa meta/link/script para consulta O(1)
+        Não se limita ao <head>: CMS que emitem meta/link no body, ou um head fechado
+        cedo pelo lxml, não podem esconder robots/charset/favicon
+        Para meta por name/http-equiv, vale a primeira ocorrência (mesma semântica do find)
+        'positions' guarda a posição (1-based) de cada filho direto do head
+        (do documento, se não houver head), por id()
+        """
+        index = {
+            'meta_by_name': {},
+            'meta_by_http_equiv': {},
+            'meta_charset': None,
+            'links': [],
+            'links_by_rel': defaultdict(list),
+            'scripts': [],
+            'positions': {}
+        }
+
+        child_position = 0
+        for child in (head if head is not None else soup).children:
+            child_position += 1
+            index['positions'][id(child)] = child_position
+
+        for tag in soup.find_all(self._INDEXED_TAGS):
+            tag_name = tag.name
+
+            if tag_name == 'meta':
+                name = tag.get('name')
+                if name:
+                    index['meta_by_name'].setdefault(name.lower(), tag)
+                http_equiv = tag.get('http-equiv')
+                if http_equiv:
+                    index['meta_by_http_equiv'].setdefault(http_equiv.lower(), tag)
+                if index['meta_charset'] is None and tag.has_attr('charset'):
+                    index['meta_charset'] = tag
+
+            elif tag_name == 'link' and tag.has_attr('rel'):
+                index['links'].append(tag)
+                for rel in self._get_rel_values(tag):
+                    index['links_by_rel'][rel].append(tag)
+
+            elif tag_name == 'script' and tag.has_attr('src'):
+                index['scripts'].append(tag)
 
-    def _parse_doctype(self, soup: BeautifulSoup, data: Dict):
+        return index
+
+    def _parse_doctype(self, ctx: Dict[str, Any], data: Dict):
         """
         Parse e validação do DOCTYPE
         """
@@ -252,50 +584,44 @@ class TechnicalParser(ParserMixin):
         doctype_valid = False
         doctype_string = ''
 
-        # Procura pelo DOCTYPE no BeautifulSoup
-        for item in soup.contents:
-            if isinstance(item, Doctype):
-                doctype_found = True
-                doctype_string = str(item).strip()
-
-                # Valida se é HTML5 (recomendado)
-                if doctype_string.lower() == 'html':
-                    doctype_valid = True
-                    data['doctype_type'] = 'HTML5'
-                elif 'html 4' in doctype_string.lower():
-                    data['doctype_type'] = 'HTML4'
-                elif 'xhtml' in doctype_string.lower():
-                    data['doctype_type'] = 'XHTML'
-                else:
-                    data['doctype_type'] = 'Unknown'
-
-                break
+        doctype = ctx['doctype']
+        if doctype is not None:
+            doctype_found = True
+            doctype_string = str(doctype).strip()
+
+            # Valida se é HTML5 (recomendado)
+            if doctype_string.lower() == 'html':
+                doctype_valid = True
+                data['doctype_type'] = 'HTML5'
+            elif 'html 4' in doctype_string.lower():
+                data['doctype_type'] = 'HTML4'
+            elif 'xhtml' in doctype_string.lower():
+                data['doctype_type'] = 'XHTML'
+            else:
+                data['doctype_type'] = 'Unknown'
 
         data['has_doctype'] = doctype_found
         data['doctype_valid'] = doctype_valid
         data['doctype_string'] = doctype_string
         data['is_html5'] = doctype_valid and data.get('doctype_type') == 'HTML5'
 
-    def _parse_html_lang(self, soup: BeautifulSoup, data: Dict):
+    def _parse_html_lang(self, ctx: Dict[str, Any], data: Dict):
         """
         Parse do atributo lang no HTML
         """
-        html_tag = soup.find('html')
+        html_tag = ctx['html']
 
         if html_tag:
             lang_attr = self.safe_get_attribute(html_tag, 'lang')
+            lang_lower = lang_attr.lower()
 
             data['has_html_lang'] = bool(lang_attr)
             data['html_lang'] = lang_attr
-            data['html_lang_valid'] = lang_attr.lower() in self.valid_lang_codes if lang_attr else False
+            data['html_lang_valid'] = lang_lower in self.valid_lang_codes
 
             # Análise adicional do lang
-            if lang_attr:
-                data['html_lang_is_generic'] = lang_attr.lower() in ['en', 'pt', 'es']  # Muito genérico
-                data['html_lang_has_country'] = '-' in lang_attr  # ex: pt-BR, en-US
-            else:
-                data['html_lang_is_generic'] = False
-                data['html_lang_has_country'] = False
+            data['html_lang_is_generic'] = lang_lower in self._generic_langs  # Muito genérico
+            data['html_lang_has_country'] = '-' in lang_lower  # ex: pt-BR, en-US
         else:
             data['has_html_lang'] = False
             data['html_lang'] = ''
@@ -303,10 +629,11 @@ class TechnicalParser(ParserMixin):
             data['html_lang_is_generic'] = False
             data['html_lang_has_country'] = False
 
-    def _parse_charset(self, soup: BeautifulSoup, data: Dict):
+    def _parse_charset(self, ctx: Dict[str, Any], data: Dict):
         """
         Parse completo da declaração de charset
         """
+        tag_index = ctx['tag_index']
         charset_found = False
         charset_value = ''
         charset_method = ''
@@ -314,27 +641,27 @@ class TechnicalParser(ParserMixin):
         charset_position = 0
 
         # Método 1: HTML5 <meta charset="utf-8">
-        charset_meta = self.safe_find(soup, 'meta', {'charset': True})
+        charset_meta = tag_index['meta_charset']
         if charset_meta:
             charset_found = True
             charset_value = self.safe_get_attribute(charset_meta, 'charset').lower()
             charset_method = 'html5'
-            charset_position = self._get_element_position(soup, charset_meta)
+            charset_position = self._get_element_position(tag_index, charset_meta)
         else:
             # Método 2: HTML4 <meta http-equiv="content-type" content="text/html; charset=utf-8">
-            content_type_meta = self.safe_find(soup, 'meta', {'http-equiv': re.compile(r'^content-type$', re.I)})
+            content_type_meta = tag_index['meta_by_http_equiv'].get('content-type')
             if content_type_meta:
                 content = self.safe_get_attribute(content_type_meta, 'content')
-                charset_match = re.search(r'charset=([^;]+)', content, re.I)
+                charset_match = self._RE_CHARSET_IN_CONTENT.search(content)
                 if charset_match:
                     charset_found = True
                     charset_value = charset_match.group(1).strip().lower()
                     charset_method = 'html4'
-                    charset_position = self._get_element_position(soup, content_type_meta)
+                    charset_position = self._get_element_position(tag_index, content_type_meta)
 
         # Validação do charset
         if charset_value:
-            charset_valid = charset_value in self.valid_charsets
+            charset_valid = charset_value in self._valid_charsets_set
 
         data['has_charset'] = charset_found
         data['charset_value'] = charset_value
@@ -344,11 +671,11 @@ class TechnicalParser(ParserMixin):
         data['charset_position'] = charset_position
         data['charset_early_declaration'] = charset_position < 10  # Dentro dos primeiros 10 elementos
 
-    def _parse_viewport(self, soup: BeautifulSoup, data: Dict):
+    def _parse_viewport(self, ctx: Dict[str, Any], data: Dict):
         """
         Parse completo do viewport para mobile optimization
         """
-        viewport_meta = self.safe_find(soup, 'meta', {'name': re.compile(r'^viewport$', re.I)})
+        viewport_meta = ctx['tag_index']['meta_by_name'].get('viewport')
         
         if viewport_meta:
             viewport_content = self.safe_get_attribute(viewport_meta, 'content')
@@ -377,21 +704,27 @@ class TechnicalParser(ParserMixin):
         issues = []
 
         # Verifica se é um dos recomendados
-        viewport_clean = viewport_content.replace(' ', '').lower()
-        is_recommended = any(rec.replace(' ', '').lower() == viewport_clean
-                           for rec in self.recommended_viewports)
+        is_recommended = viewport_lower in self._recommended_viewports_norm
 
         data['viewport_is_recommended'] = is_recommended
 
+        # Extrai todas as diretivas (width, initial-scale, ...) em uma única passada
+        # Diretiva repetida: vale a primeira ocorrência (como o re.search de antes)
+        tokens = {}
+        for key, value in self._RE_VIEWPORT_TOKENS.findall(viewport_lower):
+            tokens.setdefault(key, value)
+        width = tokens.get('width', '')
+
         # Análise de componentes específicos
-        data['viewport_has_width_device'] = 'width=device-width' in viewport_lower
+        data['viewport_has_width_device'] = width == 'device-width'
+        # initial-scale sem valor também conta como declarado
         data['viewport_has_initial_scale'] = 'initial-scale' in viewport_lower
 
         # Extrai valores específicos
-        if 'initial-scale=' in viewport_lower:
-            scale_match = re.search(r'initial-scale=([0-9.]+)', viewport_lower)
+        if 'initial-scale' in tokens:
+            scale_match = self._RE_SCALE_VALUE.match(tokens['initial-scale'])
             if scale_match:
-                initial_scale = float(scale_match.group(1))
+                initial_scale = float(scale_match.group(0))
                 data['viewport_initial_scale'] = initial_scale
                 data['viewport_scale_optimal'] = initial_scale == 1.0
 
@@ -404,53 +737,101 @@ class TechnicalParser(ParserMixin):
                 data['viewport_scale_optimal'] = False
 
         # Verifica user-scalable
-        data['viewport_user_scalable'] = 'user-scalable=no' not in viewport_lower
-        if 'user-scalable=no' in viewport_lower:
+        data['viewport_user_scalable'] = tokens.get('user-scalable') != 'no'
+        if not data['viewport_user_scalable']:
             issues.append('user_scaling_disabled')  # Pode ser problema de acessibilidade
 
         # Verifica maximum-scale
-        if 'maximum-scale=' in viewport_lower:
-            max_scale_match = re.search(r'maximum-scale=([0-9.]+)', viewport_lower)
+        if 'maximum-scale' in tokens:
+            max_scale_match = self._RE_SCALE_VALUE.match(tokens['maximum-scale'])
             if max_scale_match:
-                max_scale = float(max_scale_match.group(1))
+                max_scale = float(max_scale_match.group(0))
                 data['viewport_maximum_scale'] = max_scale
                 if max_scale < 1.0:
                     issues.append('maximum_scale_too_restrictive')
 
         # Verifica width específico (não device-width)
-        if 'width=' in viewport_lower and 'width=device-width' not in viewport_lower:
-            width_match = re.search(r'width=(\d+)', viewport_lower)
-            if width_match:
-                issues.append('fixed_width_instead_of_device')
-
-        # Score geral de mobile optimization
-        mobile_factors = [
-            data.get('viewport_has_width_device', False),
-            data.get('viewport_has_initial_scale', False),
-            data.get('viewport_scale_optimal', False),
-            data.get('viewport_user_scalable', True),  # True é melhor
-            len(issues) == 0
-        ]
-
-        data['viewport_mobile_optimized'] = sum(mobile_factors) >= 3
+        if width[:1].isdigit():
+            issues.append('fixed_width_instead_of_device')
+
+        # Score geral de mobile optimization (5 fatores, 20 pontos cada)
+        mobile_score = (
+            int(data['viewport_has_width_device']) +
+            int(data['viewport_has_initial_scale']) +
+            int(data.get('viewport_scale_optimal', False)) +
+            int(data['viewport_user_scalable']) +  # True é melhor
+            int(not issues)
+        )
+
+        data['viewport_mobile_optimized'] = mobile_score >= 3
         data['viewport_issues'] = issues
-        data['viewport_mobile_score'] = int((sum(mobile_factors) / len(mobile_factors)) * 100)
+        data['viewport_mobile_score'] = mobile_score * 20
 
-    def _parse_favicon(self, soup: BeautifulSoup, data: Dict, url: str = None):
+    def _parse_favicon(self, ctx: Dict[str, Any], data: Dict, url: str = None):
         """
         Parse completo de favicons (múltiplos formatos e tamanhos)
         """
         # Encontra todos os links relacionados a favicon
-        favicon_links = self.safe_find_all(soup, 'link', {'rel': re.compile(r'icon|shortcut|apple-touch', re.I)})
+        favicon_links = [
+            link for link in ctx['tag_index']['links']
+            if self._RE_ICON_REL.search(' '.join(self._get_rel_values(link)))
+        ]
 
-        data['favicon_links_count'] = len(favicon_links)
-        data['favicon_details'] = []
+        # O mesmo conjunto de favicons se repete nas páginas da mesma origem:
+        # reaproveita o bloco já calculado quando os <link> são idênticos
+        cache_key = self._favicon_cache_key(favicon_links, url)
+        if cache_key is not None:
+            with self._favicon_cache_lock:
+                cached_block = self._favicon_cache.get(cache_key)
+                if cached_block is not None:
+                    self._favicon_cache.move_to_end(cache_key)
+
+            if cached_block is not None:
+                data.update({key: list(value) if isinstance(value, list) else value
+                             for key, value in cached_block.items()})
+                return
+
+        favicon_data = self._build_favicon_data(favicon_links, url)
+        data.update(favicon_data)
+
+        if cache_key is not None:
+            with self._favicon_cache_lock:
+                self._favicon_cache[cache_key] = favicon_data
+                if len(self._favicon_cache) > self.favicon_cache_size:
+                    self._favicon_cache.popitem(last=False)
+
+    def _favicon_cache_key(self, favicon_links: List[Tag], url: str = None) -> Optional[Tuple]:
+        """
+        Chave do cache de favicons: (scheme, netloc, hash dos <link>)
+        Retorna None quando algum href é relativo ao caminho da página (full_href varia por página)
+        """
+        if not url:
+            return None
+
+        fingerprint = []
+        for link in favicon_links:
+            href = link.get('href') or ''
+            if href and not href.startswith(('/', 'http://', 'https://', 'data:')):
+                return None
+            fingerprint.append((tuple(self._get_rel_values(link)), href, link.get('sizes'), link.get('type')))
+
+        parsed = urlparse(url)
+        return parsed.scheme, parsed.netloc, hash(tuple(fingerprint))
+
+    def _build_favicon_data(self, favicon_links: List[Tag], url: str = None) -> Dict[str, Any]:
+        """
+        Calcula os campos de favicon a partir dos <link> encontrados
+        """
+        data = {
+            'favicon_links_count': len(favicon_links),
+            'favicon_details': []
+        }
 
         if not favicon_links:
             data['has_favicon'] = False
             data['favicon_formats'] = []
             data['favicon_coverage_score'] = 0
-            return
+            return data
 
         data['has_favicon'] = True
 
@@ -463,12 +844,6 @@ class TechnicalParser(ParserMixin):
             sizes = self.safe_get_attribute(link, 'sizes')
             type_attr = self.safe_get_attribute(link, 'type')
 
-            # Resolve URL completa
-            if url and href:
-                full_href = urljoin(url, href) if not href.startswith('http') else href
-            else:
-                full_href = href
-
             # Determina formato
             favicon_format = self._determine_favicon_format(rel, href, type_attr)
             if favicon_format:
@@ -479,6 +854,15 @@ class TechnicalParser(ParserMixin):
                 sizes_list = [s.strip() for s in sizes.split(',')]
                 favicon_sizes.update(sizes_list)
 
+            if not self.verbose_details:
+                continue
+
+            # Resolve URL completa
+            if url and href:
+                full_href = urljoin(url, href) if not href.startswith('http') else href
+            else:
+                full_href = href
+
             favicon_details = {
                 'rel': rel,
                 'href': href,
@@ -486,7 +870,7 @@ class TechnicalParser(ParserMixin):
                 'sizes': sizes,
                 'type': type_attr,
                 'format': favicon_format,
-                'is_valid_url': self.is_valid_url(full_href) if full_href else False
+                'is_valid_url': bool(full_href) and full_href.startswith(('http://', 'https://')) and self._is_valid_url_cached(full_href)
             }
             data['favicon_details'].append(favicon_details)
 
@@ -495,6 +879,8 @@ class TechnicalParser(ParserMixin):
 
         # Análise de cobertura
         self._analyze_favicon_coverage(data)
+
+        return data
     
     def _determine_favicon_format(self, rel: str, href: str, type_attr: str) -> str:
         """
@@ -508,14 +894,8 @@ class TechnicalParser(ParserMixin):
             return 'svg'
         elif href:
             href_lower = href.lower()
-            if href_lower.endswith('.ico'):
-                return 'ico'
-            elif href_lower.endswith('.png'):
-                return 'png'
-            elif href_lower.endswith('.svg'):
-                return 'svg'
-            elif href_lower.endswith('.gif'):
-                return 'gif'
+            ext = href_lower.rsplit('.', 1)[-1] if '.' in href_lower else ''
+            return self._EXT_MAP.get('.' + ext, 'unknown')
 
         return 'unknown'
 
@@ -545,17 +925,17 @@ class TechnicalParser(ParserMixin):
         has_large = any(size in sizes for size in ['192x192', '180x180'])
         coverage_factors.append(has_small and has_large)
 
-        data['favicon_coverage_score'] = int((sum(coverage_factors) / len(coverage_factors)) * 100)
+        data['favicon_coverage_score'] = _FAVICON_COVERAGE_SCORES[sum(coverage_factors)]
         data['favicon_has_modern_formats'] = 'svg' in formats
         data['favicon_has_apple_touch'] = 'apple-touch-icon' in formats
         data['favicon_has_multiple_sizes'] = len(sizes) >= 2
 
-    def _parse_amp_detection(self, soup: BeautifulSoup, data: Dict):
+    def _parse_amp_detection(self, ctx: Dict[str, Any], data: Dict):
         """
         Detecção completa de páginas AMP
         """
         # Método 1: atributo amp ou ⚡ na tag html
-        html_tag = soup.find('html')
+        html_tag = ctx['html']
         is_amp_html = False
 
         if html_tag:
@@ -563,13 +943,15 @@ class TechnicalParser(ParserMixin):
                           html_tag.has_attr('⚡') or
                           html_tag.has_attr('data-ampdevmode'))
 
+        tag_index = ctx['tag_index']
+
         # Método 2: meta tags AMP
-        amp_canonical = self.safe_find(soup, 'link', {'rel': 'amphtml'})
-        canonical_amp = self.safe_find(soup, 'link', {'rel': 'canonical'})
+        amp_canonical = next(iter(tag_index['links_by_rel'].get('amphtml', [])), None)
+        canonical_amp = next(iter(tag_index['links_by_rel'].get('canonical', [])), None)
 
         # Método 3: scripts AMP
-        amp_scripts = self.safe_find_all(soup, 'script', {'src': re.compile(r'ampproject\.org', re.I)})
-        amp_runtime = self.safe_find(soup, 'script', {'src': re.compile(r'v0\.js', re.I)})
+        amp_scripts = [script for script in tag_index['scripts'] if self._RE_AMPPROJECT.search(script['src'])]
+        amp_runtime = next((script for script in tag_index['scripts'] if self._RE_V0JS.search(script['src'])), None)
 
         data['is_amp'] = is_amp_html
         data['has_amp_canonical'] = amp_canonical is not None
@@ -588,12 +970,14 @@ class TechnicalParser(ParserMixin):
             data['amp_type'] = 'no_amp'
             data['amp_validation_required'] = False
 
-    def _parse_meta_robots_advanced(self, soup: BeautifulSoup, data: Dict):
+    def _parse_meta_robots_advanced(self, ctx: Dict[str, Any], data: Dict):
         """
         Parse avançado de meta robots e diretivas de crawling
         """
+        meta_by_name = ctx['tag_index']['meta_by_name']
+
         # Meta robots padrão
-        meta_robots = self.find_meta_by_name(soup, 'robots')
+        meta_robots = meta_by_name.get('robots')
 
         if meta_robots:
             robots_content = self.extract_meta_content(meta_robots).lower()
@@ -612,10 +996,10 @@ class TechnicalParser(ParserMixin):
             data['robots_allows_following'] = True  # Default
 
         # Meta robots específicos por bot
-        self._parse_bot_specific_robots(soup, data)
+        self._parse_bot_specific_robots(meta_by_name, data)
 
         # Meta refresh (pode impactar SEO)
-        meta_refresh = self.find_meta_by_name(soup, 'refresh') or self.safe_find(soup, 'meta', {'http-equiv': re.compile(r'^refresh$', re.I)})
+        meta_refresh = meta_by_name.get('refresh') or ctx['tag_index']['meta_by_http_equiv'].get('refresh')
         if meta_refresh:
             refresh_content = self.extract_meta_content(meta_refresh)
             data['has_meta_refresh'] = True
@@ -643,12 +1027,11 @@ class TechnicalParser(ParserMixin):
         data['robots_allows_following'] = not data['robots_nofollow']
         
         # Verifica diretivas inválidas
-        valid_directives = set(self.valid_robots_directives)
-        invalid_directives = [d for d in directives if d not in valid_directives and d]
+        invalid_directives = [d for d in directives if d not in self._valid_robots_set and d]
         data['robots_invalid_directives'] = invalid_directives
         data['robots_has_invalid_directives'] = len(invalid_directives) > 0
 
-    def _parse_bot_specific_robots(self, soup: BeautifulSoup, data: Dict):
+    def _parse_bot_specific_robots(self, meta_by_name: Dict[str, Tag], data: Dict):
         """
         Parse de meta robots específicos por bot
         """
@@ -658,7 +1041,7 @@ class TechnicalParser(ParserMixin):
         bots = ['googlebot', 'bingbot', 'slurp', 'duckduckbot', 'baiduspider', 'yandexbot']
 
         for bot in bots:
-            bot_meta = self.find_meta_by_name(soup, bot)
+            bot_meta = meta_by_name.get(bot)
             if bot_meta:
                 bot_content = self.extract_meta_content(bot_meta)
                 bot_robots[bot] = bot_content
@@ -666,17 +1049,22 @@ class TechnicalParser(ParserMixin):
         data['bot_specific_robots'] = bot_robots
         data['has_bot_specific_robots'] = len(bot_robots) > 0
 
-    def _parse_performance_hints(self, soup: BeautifulSoup, data: Dict, url: str = None):
+    def _parse_performance_hints(self, ctx: Dict[str, Any], data: Dict, url: str = None):
         """
         Parse de performance hints (dns-prefetch, preload, etc.)
         """
         performance_links = []
         hint_counts = {}
+        links_by_rel = ctx['tag_index']['links_by_rel']
+        base_netloc = _netloc(url) if url else None
 
         for hint in self.performance_hints:
-            links = self.safe_find_all(soup, 'link', {'rel': hint})
+            links = links_by_rel.get(hint, [])
             hint_counts[hint] = len(links)
 
+            if not self.verbose_details:
+                continue
+
             for link in links:
                 href = self.safe_get_attribute(link, 'href')
                 as_attr = self.safe_get_attribute(link, 'as')
@@ -687,10 +1075,10 @@ class TechnicalParser(ParserMixin):
                     'href': href,
                     'as': as_attr,
                     'type': type_attr,
-                    'is_external': self._is_external_domain(href, url) if url else False
+                    'is_external': self._is_external_domain(href, base_netloc) if base_netloc else False
                 })
 
-        data['performance_hints_count'] = len(performance_links)
+        data['performance_hints_count'] = sum(hint_counts.values())
         data['performance_hints_details'] = performance_links
         data['performance_hints_by_type'] = hint_counts
 
@@ -704,12 +1092,14 @@ class TechnicalParser(ParserMixin):
             data['uses_preload']
         ]) >= 2
 
-    def _parse_security_headers(self, soup: BeautifulSoup, data: Dict):
+    def _parse_security_headers(self, ctx: Dict[str, Any], data: Dict):
         """
         Parse de headers de segurança via meta tags
         """
+        meta_by_http_equiv = ctx['tag_index']['meta_by_http_equiv']
+
         # Content Security Policy
-        csp_meta = self.safe_find(soup, 'meta', {'http-equiv': re.compile(r'^content-security-policy$', re.I)})
+        csp_meta = meta_by_http_equiv.get('content-security-policy')
         if csp_meta:
             csp_content = self.safe_get_attribute(csp_meta, 'content')
             data['has_csp_meta'] = True
@@ -719,7 +1109,7 @@ class TechnicalParser(ParserMixin):
             data['csp_meta_content'] = ''
 
         # X-Frame-Options
-        xframe_meta = self.safe_find(soup, 'meta', {'http-equiv': re.compile(r'^x-frame-options$', re.I)})
+        xframe_meta = meta_by_http_equiv.get('x-frame-options')
         if xframe_meta:
             xframe_content = self.safe_get_attribute(xframe_meta, 'content')
             data['has_xframe_meta'] = True
@@ -729,7 +1119,7 @@ class TechnicalParser(ParserMixin):
             data['xframe_meta_content'] = ''
 
         # Referrer Policy
-        referrer_meta = self.find_meta_by_name(soup, 'referrer')
+        referrer_meta = ctx['tag_index']['meta_by_name'].get('referrer')
         if referrer_meta:
             referrer_content = self.extract_meta_content(referrer_meta)
             data['has_referrer_policy'] = True
@@ -744,73 +1134,54 @@ class TechnicalParser(ParserMixin):
             data['has_referrer_policy']
         ])
 
-    def _parse_html_structure(self, soup: BeautifulSoup, data: Dict):
+    def _parse_html_structure(self, ctx: Dict[str, Any], data: Dict):
         """
         Parse da estrutura básica do HTML
         """
         # Tags obrigatórias
-        data['has_html_tag'] = soup.find('html') is not None
-        data['has_head_tag'] = soup.find('head') is not None
-        data['has_body_tag'] = soup.find('body') is not None
-        data['has_title_tag'] = soup.find('title') is not None
-
-        # Estrutura básica válida
-        required_structure = [
-            data['has_html_tag'],
-            data['has_head_tag'],
-            data['has_body_tag'],
-            data['has_title_tag']
-        ]
+        data['has_html_tag'] = ctx['html'] is not None
+        data['has_head_tag'] = ctx['head'] is not None
+        data['has_body_tag'] = ctx['body'] is not None
+        data['has_title_tag'] = ctx['title'] is not None
+
+        # Estrutura básica válida (4 tags, 25 pontos cada)
+        total = data['has_html_tag'] + data['has_head_tag'] + data['has_body_tag'] + data['has_title_tag']
 
-        data['html_structure_valid'] = all(required_structure)
-        data['html_structure_score'] = int((sum(required_structure) / len(required_structure)) * 100)
+        data['html_structure_valid'] = total == 4
+        data['html_structure_score'] = total * 25
 
     def _analyze_technical_quality(self, data: Dict):
         """
         Analisa qualidade técnica geral
         """
-        quality_factors = [
-            data.get('doctype_valid', False),
-            data.get('has_html_lang', False),
-            data.get('charset_is_utf8', False),
-            data.get('has_viewport', False),
-            data.get('has_favicon', False),
-            data.get('html_structure_valid', False),
-            data.get('robots_allows_indexing', True),
-            not data.get('has_meta_refresh', False)  # Refresh é problemático
-        ]
+        quality_count = (
+            sum(map(bool, _QUALITY_GETTER(data))) +
+            (not data['has_meta_refresh'])  # Refresh é problemático
+        )
         
-        data['technical_quality_score'] = int((sum(quality_factors) / len(quality_factors)) * 100)
-        data['technical_standards_compliant'] = sum(quality_factors) >= 6
+        data['technical_quality_score'] = _QUALITY_SCORES[quality_count]
+        data['technical_standards_compliant'] = quality_count >= 6
 
     def _analyze_mobile_optimization(self, data: Dict):
         """
         Analisa otimização para mobile
         """
-        mobile_factors = [
-            data.get('has_viewport', False),
-            data.get('viewport_mobile_optimized', False),
-            data.get('favicon_has_apple_touch', False),
-            data.get('html_lang_valid', False)
-        ]
+        mobile_count = sum(map(bool, _MOBILE_GETTER(data)))
 
-        data['mobile_optimization_score'] = int((sum(mobile_factors) / len(mobile_factors)) * 100)
-        data['mobile_ready'] = sum(mobile_factors) >= 3
+        data['mobile_optimization_score'] = _MOBILE_SCORES[mobile_count]
+        data['mobile_ready'] = mobile_count >= 3
 
     def _analyze_performance_optimization(self, data: Dict):
         """
         Analisa otimização de performance
         """
-        performance_factors = [
-            data.get('charset_early_declaration', False),
-            data.get('uses_dns_prefetch', False),
-            data.get('uses_preconnect', False),
-            data.get('uses_preload', False),
-            not data.get('has_meta_refresh', False)
-        ]
+        performance_count = (
+            sum(map(bool, _PERFORMANCE_GETTER(data))) +
+            (not data['has_meta_refresh'])
+        )
         
-        data['performance_optimization_score'] = int((sum(performance_factors) / len(performance_factors)) * 100)
-        data['performance_optimized'] = sum(performance_factors) >= 3
+        data['performance_optimization_score'] = _PERFORMANCE_SCORES[performance_count]
+        data['performance_optimized'] = performance_count >= 3
 
     def _detect_technical_issues(self, data: Dict):
         """
@@ -818,43 +1189,12 @@ class TechnicalParser(ParserMixin):
         """
         issues = []
 
-        # Problemas críticos
-        if not data.get('has_doctype', False):
-            issues.append('doctype_ausente')
-        elif not data.get('doctype_valid', False):
-            issues.append('doctype_invalido')
-        
-        if not data.get('has_charset', False):
-            issues.append('charset_ausente')
-        elif not data.get('charset_is_utf8', False):
-            issues.append('charset_nao_utf8')
-
-        # Problemas de mobile
-        if not data.get('has_viewport', False):
-            issues.append('viewport_ausente')
-        elif not data.get('viewport_mobile_optimized', False):
-            issues.append('viewport_nao_otimizado')
-
-        # Problemas de estrutura
-        if not data.get('html_structure_valid', False):
-            issues.append('estrutura_html_invalida')
-
-        if not data.get('has_html_lang', False):
-            issues.append('lang_ausente')
-        elif not data.get('html_lang_valid', False):
-            issues.append('lang_invalido')
-
-        # Problemas de SEO
-        if data.get('robots_noindex', False):
-            issues.append('pagina_bloqueada_indexacao')
-        
-        if data.get('has_meta_refresh', False):
-            issues.append('meta_refresh_presente')
+        for key, expected, issue, valid_key, invalid_issue in _ISSUE_RULES:
+            if bool(data.get(key, False)) != expected:
+                issues.append(issue)
+            elif valid_key is not None and not data.get(valid_key, False):
+                issues.append(invalid_issue)
 
-        # Problemas de performance
-        if not data.get('charset_early_declaration', False):
-            issues.append('charset_declaracao_tardia')
-        
         data['technical_issues'] = issues
         data['technical_issues_count'] = len(issues)
 
@@ -864,17 +1204,20 @@ class TechnicalParser(ParserMixin):
         """
         issues = data.get('technical_issues', [])
 
+        # Página sem issues: nada a mapear nem categorizar
+        if not issues:
+            data['technical_severity_level'] = SeverityLevel.BAIXA
+            data['technical_problems_keys'] = []
+            data['technical_problems_by_severity'] = {
+                SeverityLevel.CRITICA: [],
+                SeverityLevel.ALTA: [],
+                SeverityLevel.MEDIA: [],
+                SeverityLevel.BAIXA: []
+            }
+            return
+
         # Mapeia issues para chaves de severity
-        severity_issues = []
-        for issue in issues:
-            if issue in ['doctype_ausente', 'charset_ausente', 'estrutura_html_invalida']:
-                severity_issues.append('html_estrutura_critica')
-            elif issue in ['viewport_ausente', 'viewport_nao_otimizado']:
-                severity_issues.append('mobile_nao_otimizado')
-            elif issue in ['pagina_bloqueada_indexacao', 'meta_refresh_presente']:
-                severity_issues.append('seo_tecnico_problematico')
-            else:
-                severity_issues.append('tecnico_nao_otimizado')
+        severity_issues = [_ISSUE_TO_SEVERITY.get(issue, 'tecnico_nao_otimizado') for issue in issues]
         
         # Calcula severidade geral
         data['technical_severity_level'] = self.calculate_problem_severity(severity_issues)
@@ -885,48 +1228,44 @@ class TechnicalParser(ParserMixin):
     # MÉTODOS AUXILIARES
     # ==========================================
 
-    def _get_element_position(self, soup: BeautifulSoup, element: Tag) -> int:
+    def _get_element_position(self, tag_index: Dict[str, Any], element: Tag) -> int:
         """
         Obtém a posição de um elemento no head (para charset)
         """
-        try:
-            head_tag = soup.find('head')
-            if head_tag and element:
-                head_children = [child for child in head_tag.children if hasattr(child, 'name')]
-                return head_children.index(element) + 1
-        except:
-            pass
-        return 999  # Posição muito alta se não conseguir determinar
+        # Posição muito alta se não conseguir determinar (fora do head)
+        return tag_index['positions'].get(id(element), 999)
+
+    def _get_rel_values(self, link: Tag) -> List[str]:
+        """
+        Retorna os valores do atributo rel normalizados em minúsculas
+        """
+        rel = link.get('rel') or []
+        if isinstance(rel, str):
+            rel = rel.split()
+        return list(dict.fromkeys(value.lower() for value in rel))
 
     def _extract_refresh_delay(self, refresh_content: str) -> int:
         """
         Extrai delay do meta refresh
         """
-        try:
-            # Formato: "5; url=http://example.com" ou apenas "5"
-            delay_match = re.search(r'^(\d+)', refresh_content.strip())
-            if delay_match:
-                return int(delay_match.group(1))
-        except:
-            pass
-        return 0
+        # Formato: "5; url=http://example.com" ou apenas "5"
+        delay_match = self._RE_REFRESH_DELAY.match(refresh_content)
+        return int(delay_match.group(1)) if delay_match else 0
     
-    def _is_external_domain(self, href: str, base_url: str) -> bool:
+    def _is_external_domain(self, href: str, base_netloc: str) -> bool:
         """
         Verifica se href é de domínio externo
+        base_netloc vem pré-calculado uma vez por página (ver _netloc)
         """
-        if not href or not base_url:
+        if not href or not base_netloc:
             return False
 
-        try:
-            if not href.startswith('http'):
-                return False  # Relativo = interno
-
-            href_domain = urlparse(href).netloc
-            base_domain = urlparse(base_url).netloc
+        if not href.startswith('http'):
+            return False  # Relativo = interno
 
-            return href_domain != base_domain
-        except:
+        try:
+            return _netloc(href) != base_netloc
+        except ValueError:
             return False
 
     # ==========================================
@@ -937,74 +1276,155 @@ class TechnicalParser(ParserMixin):
         """
         Gera resumo da análise técnica
         """
-        return {
-            'technical_quality_score': parsed_data.get('technical_quality_score', 0),
-            'mobile_optimization_score': parsed_data.get('mobile_optimization_score', 0),
-            'performance_optimization_score': parsed_data.get('performance_optimization_score', 0),
-            'is_html5': parsed_data.get('is_html5', False),
-            'mobile_ready': parsed_data.get('mobile_ready', False),
-            'performance_optimized': parsed_data.get('performance_optimized', False),
-            'technical_severity_level': parsed_data.get('technical_severity_level', SeverityLevel.BAIXA),
-            'main_issues': parsed_data.get('technical_issues', [])[:3],
-            'has_critical_issues': any(issue in parsed_data.get('technical_issues', [])
-                                     for issue in ['doctype_ausente', 'charset_ausente', 'viewport_ausente']),
-            'favicon_coverage': parsed_data.get('favicon_coverage_score', 0),
-            'security_headers_count': parsed_data.get('security_headers_count', 0)
-        }
+        return self._build_report_parts(parsed_data)[0]
 
     def validate_technical_best_practices(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Valida boas práticas técnicas
         """
+        return self._build_report_parts(parsed_data)[1]
+
+    def build_report(self, parsed_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Resumo + validação de boas práticas em uma única passada pelos dados
+        (equivale a get_technical_summary seguido de validate_technical_best_practices)
+        """
+        summary, validations = self._build_report_parts(parsed_data)
+        summary.update(validations)
+        return summary
+
+    def _build_report_parts(self, parsed_data: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Lê cada chave de parsed_data uma única vez e monta (resumo, validações)
+        """
+        g = parsed_data.get
+        technical_issues = g('technical_issues', [])
+        is_html5 = g('is_html5', False)
+        mobile_ready = g('mobile_ready', False)
+        performance_optimized = g('performance_optimized', False)
+        severity_level = g('technical_severity_level', SeverityLevel.BAIXA)
+        favicon_coverage = g('favicon_coverage_score', 0)
+
+        summary = {
+            'technical_quality_score': g('technical_quality_score', 0),
+            'mobile_optimization_score': g('mobile_optimization_score', 0),
+            'performance_optimization_score': g('performance_optimization_score', 0),
+            'is_html5': is_html5,
+            'mobile_ready': mobile_ready,
+            'performance_optimized': performance_optimized,
+            'technical_severity_level': severity_level,
+            'main_issues': technical_issues[:3],
+            'has_critical_issues': not _CRITICAL_ISSUES.isdisjoint(technical_issues),
+            'favicon_coverage': favicon_coverage,
+            'security_headers_count': g('security_headers_count', 0)
+        }
+
         validations = {}
 
         # HTML5 e estrutura
-        validations['uses_html5'] = parsed_data.get('is_html5', False)
-        validations['valid_html_structure'] = parsed_data.get('html_structure_valid', False)
-        validations['has_proper_charset'] = parsed_data.get('charset_is_utf8', False)
-        validations['early_charset_declaration'] = parsed_data.get('charset_early_declaration', False)
+        validations['uses_html5'] = is_html5
+        validations['valid_html_structure'] = g('html_structure_valid', False)
+        validations['has_proper_charset'] = g('charset_is_utf8', False)
+        validations['early_charset_declaration'] = g('charset_early_declaration', False)
 
         # Internacionalização
-        validations['has_language_declaration'] = parsed_data.get('has_html_lang', False)
-        validations['valid_language_code'] = parsed_data.get('html_lang_valid', False)
+        validations['has_language_declaration'] = g('has_html_lang', False)
+        validations['valid_language_code'] = g('html_lang_valid', False)
 
         # Mobile optimization
-        validations['mobile_viewport'] = parsed_data.get('has_viewport', False)
-        validations['mobile_optimized_viewport'] = parsed_data.get('viewport_mobile_optimized', False)
-        validations['mobile_ready'] = parsed_data.get('mobile_ready', False)
+        validations['mobile_viewport'] = g('has_viewport', False)
+        validations['mobile_optimized_viewport'] = g('viewport_mobile_optimized', False)
+        validations['mobile_ready'] = mobile_ready
 
         # Icons e branding
-        validations['has_favicon'] = parsed_data.get('has_favicon', False)
-        validations['good_favicon_coverage'] = parsed_data.get('favicon_coverage_score', 0) >= 70
+        validations['has_favicon'] = g('has_favicon', False)
+        validations['good_favicon_coverage'] = favicon_coverage >= 70
 
         # Performance
-        validations['uses_performance_hints'] = parsed_data.get('performance_hints_count', 0) > 0
-        validations['performance_optimized'] = parsed_data.get('performance_optimized', False)
-        
+        validations['uses_performance_hints'] = g('performance_hints_count', 0) > 0
+        validations['performance_optimized'] = performance_optimized
+
         # SEO técnico
-        validations['indexing_allowed'] = parsed_data.get('robots_allows_indexing', True)
-        validations['no_meta_refresh'] = not parsed_data.get('has_meta_refresh', False)
-
-        # Sem problemas críticos
-        validations['no_critical_technical_issues'] = parsed_data.get('technical_severity_level') != SeverityLevel.CRITICA   
-
-        # Score geral
-        score_items = [
-            validations['uses_html5'],
-            validations['valid_html_structure'],
-            validations['has_proper_charset'],
-            validations['has_language_declaration'],
-            validations['mobile_viewport'],
-            validations['mobile_optimized_viewport'],
-            validations['has_favicon'],
-            validations['indexing_allowed'],
-            validations['no_meta_refresh'],
-            validations['no_critical_technical_issues']
-        ]
+        validations['indexing_allowed'] = g('robots_allows_indexing', True)
+        validations['no_meta_refresh'] = not g('has_meta_refresh', False)
+
+        # Sem problemas críticos (sem default: ausência conta como não crítico)
+        validations['no_critical_technical_issues'] = g('technical_severity_level') != SeverityLevel.CRITICA
 
-        validations['technical_best_practices_score'] = int((sum(score_items) / len(score_items)) * 100)
+        # Score geral (10 itens, 10 pontos cada)
+        validations['technical_best_practices_score'] = sum(_BEST_PRACTICES_GETTER(validations)) * 10
 
-        return validations
+        return summary, validations
+
+
+# ==========================================
+# VERIFICAÇÃO DE REDIRECTS EM LOTE
+# ==========================================
+
+class RedirectChecker:
+    """
+    Verifica redirects de links internos de várias páginas em lote
+    Deduplica os links globalmente (um link presente em N páginas é verificado uma vez)
+    e executa os HEADs em paralelo reaproveitando a sessão HTTP do TechnicalParser
+    """
+
+    def __init__(self, parser: TechnicalParser, max_workers: int = 8,
+                 should_stop: Optional[Callable[[], bool]] = None):
+        self.parser = parser
+        self.max_workers = max(1, max_workers)
+        self.should_stop = should_stop or (lambda: False)
+        self.logger = get_logger('RedirectChecker')
+
+    def run(self, pages: Dict[str, List[str]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Verifica todos os links das páginas informadas
+
+        Args:
+            pages: Mapa {url_da_pagina: [links_internos]}
+
+        Returns:
+            Mapa {link: redirect_info} com cada link verificado uma única vez
+            (interrompido por should_stop, contém só os links já verificados)
+        """
+        unique_links = list(dict.fromkeys(link for links in pages.values() for link in links))
+        if not unique_links or self.should_stop():
+            return {}
+
+        total_links = sum(len(links) for links in pages.values())
+        self.logger.info(f"🔄 Verificando redirects de {len(unique_links)} links únicos "
+                         f"({total_links} ocorrências em {len(pages)} páginas)...")
+
+        results = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            futures = {executor.submit(self._check, link): link for link in unique_links}
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+                if self.should_stop():
+                    self.logger.info(f"⚠️ Verificação de redirects interrompida ({len(results)}/{len(unique_links)} links)")
+                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        return results
+
+    def apply(self, pages: Dict[str, List[str]], redirect_results: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Monta os campos de redirect de cada página a partir dos resultados globais
+
+        Returns:
+            Mapa {url_da_pagina: redirect_data}
+        """
+        return {
+            page_url: self.parser.build_redirect_data(page_url, links, redirect_results)
+            for page_url, links in pages.items()
+        }
+
+    def _check(self, url: str) -> Dict[str, Any]:
+        """Verifica uma URL respeitando o rate limiting do parser"""
+        redirect_info = self.parser._safe_check_redirect(url)
+        time.sleep(self.parser.redirect_delay)
+        return redirect_info
 
 
 # ==========================================
@@ -1022,17 +1442,20 @@ def parse_technical_elements(html_content: str, url: str = 'https://example.com'
     Returns:
         Dict com dados técnicos parseados
     """
-    from bs4 import BeautifulSoup
-    
-    soup = BeautifulSoup(html_content, 'lxml')
-    parser = TechnicalParser()
+    parser = TechnicalParser(verbose_details=True)
     
     # Parse básico
-    data = parser.parse(soup, url)
+    data = parser.parse_html(html_content, url)
+
+    # Verificação de redirects (no crawl completo é feita em lote pelo crawler)
+    links = data.pop('_internal_links_for_redirect_check', None)
+    if links is not None:
+        checker = RedirectChecker(parser)
+        pages = {url: links}
+        data.update(checker.apply(pages, checker.run(pages))[url])
     
     # Adiciona análises extras
-    data.update(parser.get_technical_summary(data))
-    data.update(parser.validate_technical_best_practices(data))
+    data.update(parser.build_report(data))
     
     return data
 
@@ -7,7 +7,10 @@ import logging
 import logging.handlers
 import os
 import sys
+import time
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -27,23 +30,42 @@ class SEOFrogFormatter(logging.Formatter):
     def __init__(self, use_colors: bool = True):
         self.use_colors = use_colors
         super().__init__()
+        
+        # Timestamp formatado do último segundo visto (logs em rajada reaproveitam)
+        self._ts_sec = -1
+        self._ts_str = ""
+        
+        # Nome do logger já truncado/alinhado em 20 colunas (poucos nomes distintos)
+        self._name_cache = {}
+        
+        # Coluna de level pronta (com ou sem cor) para os níveis padrão
+        if use_colors:
+            self._level_cache = {
+                name: f"{color}{name:<8}{self.COLORS['RESET']}"
+                for name, color in self.COLORS.items() if name != 'RESET'
+            }
+        else:
+            self._level_cache = {name: f"{name:<8}" for name in self.COLORS if name != 'RESET'}
     
     def format(self, record):
-        # Timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime('%Y-%m-%d %H:%M:%S')
+        # Timestamp (strftime só quando muda o segundo)
+        sec = int(record.created)
+        if sec != self._ts_sec:
+            self._ts_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(sec))
+            self._ts_sec = sec
+        timestamp = self._ts_str
         
         # Level com cor se habilitado
-        level = record.levelname
-        if self.use_colors and level in self.COLORS:
-            level = f"{self.COLORS[level]}{level:<8}{self.COLORS['RESET']}"
-        else:
-            level = f"{level:<8}"
+        level = self._level_cache.get(record.levelname)
+        if level is None:
+            level = f"{record.levelname:<8}"
         
         # Logger name truncado
-        logger_name = record.name
-        if len(logger_name) > 20:
-            logger_name = logger_name[:17] + "..."
-        logger_name = f"{logger_name:<20}"
+        logger_name = self._name_cache.get(record.name)
+        if logger_name is None:
+            name = record.name
+            logger_name = (name[:17] + "...") if len(name) > 20 else name.ljust(20)
+            self._name_cache[name] = logger_name
         
         # Thread info se disponível
         thread_info = ""
@@ -53,9 +75,11 @@ class SEOFrogFormatter(logging.Formatter):
         # Message
         message = record.getMessage()
         
-        # Exception info se houver
+        # Exception info se houver (traceback formatado uma vez e reaproveitado pelos demais handlers)
         if record.exc_info:
-            message += f"\n{self.formatException(record.exc_info)}"
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            message += "\n" + record.exc_text
         
         return f"{timestamp} | {level} | {logger_name} | {thread_info}{message}"
 
@@ -72,6 +96,24 @@ class PerformanceFilter(logging.Filter):
         
         return True
 
+class FastRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler que só consulta o sistema de arquivos perto do limite
+    O shouldRollover padrão faz os.path.exists/isfile a cada emit
+    """
+    
+    def shouldRollover(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        
+        if self.maxBytes > 0:
+            msg = "%s\n" % self.format(record)
+            if self.stream.tell() + len(msg) < self.maxBytes:
+                return False
+            return super().shouldRollover(record)
+        
+        return False
+
 def setup_logging(
     level: str = "INFO",
     output_dir: str = "seofrog_output",
@@ -99,17 +141,20 @@ def setup_logging(
     # Remove handlers existentes
     root_logger = logging.getLogger()
     for handler in root_logger.handlers[:]:
+        handler.flush()  # Descarrega buffers (MemoryHandler) de um setup anterior
         root_logger.removeHandler(handler)
     
+    # Timestamp único para os nomes de arquivo (log principal e de erros)
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    
     # Determina filename se não fornecido
     if not log_filename:
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         log_filename = f"seofrog_{timestamp}.log"
     
     log_filepath = os.path.join(output_dir, log_filename)
     
     # === FILE HANDLER com rotação ===
-    file_handler = logging.handlers.RotatingFileHandler(
+    file_handler = FastRotatingFileHandler(
         log_filepath,
         maxBytes=max_file_size,
         backupCount=backup_count,
@@ -119,20 +164,30 @@ def setup_logging(
     file_handler.setFormatter(SEOFrogFormatter(use_colors=False))
     file_handler.addFilter(PerformanceFilter())
     
+    # Buffer pequeno na frente do arquivo: agrupa escritas sem segurar muitas linhas
+    # (WARNING ou superior descarrega na hora; logging.shutdown descarrega na saída)
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=64,
+        flushLevel=logging.WARNING,
+        target=file_handler,
+        flushOnClose=True
+    )
+    buffered_file_handler.setLevel(file_handler.level)
+    
     # === CONSOLE HANDLER ===
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)  # Console sempre INFO ou superior
-    console_handler.setFormatter(SEOFrogFormatter(use_colors=True))
+    console_handler.setFormatter(SEOFrogFormatter(use_colors=sys.stdout.isatty()))  # Sem ANSI se redirecionado
     
     # === ERROR HANDLER (arquivo separado) ===
-    error_filepath = os.path.join(output_dir, f"seofrog_errors_{datetime.now().strftime('%Y%m%d')}.log")
+    error_filepath = os.path.join(output_dir, f"seofrog_errors_{timestamp[:8]}.log")
     error_handler = logging.FileHandler(error_filepath, encoding='utf-8')
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(SEOFrogFormatter(use_colors=False))
     
     # === ROOT LOGGER CONFIG ===
     root_logger.setLevel(logging.DEBUG)  # Captura tudo, handlers filtram
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(buffered_file_handler)
     root_logger.addHandler(console_handler)
     root_logger.addHandler(error_handler)
     
@@ -145,9 +200,10 @@ def setup_logging(
     
     return main_logger
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """Retorna logger para módulo específico"""
-    return logging.getLogger(f'SEOFrog.{name}')
+    return logging.getLogger('SEOFrog.' + name)
 
 class CrawlProgressLogger:
     """Logger especializado para progresso de crawl"""
@@ -155,49 +211,60 @@ class CrawlProgressLogger:
     def __init__(self, logger: logging.Logger, log_interval: int = 50):
         self.logger = logger
         self.log_interval = log_interval
-        self.start_time = datetime.now()
+        self.start_time = time.monotonic()  # Relógio monotônico: só para tempo decorrido
         self.last_count = 0
         self.last_time = self.start_time
+        self._next_log_at = 1  # Primeiro log logo na 1ª URL
     
     def log_progress(self, current_count: int, total_target: int, queue_size: int = 0):
         """Log de progresso com estatísticas"""
         
-        if current_count % self.log_interval == 0 or current_count == 1:
-            now = datetime.now()
-            
-            # Calcula estatísticas
-            elapsed = (now - self.start_time).total_seconds()
-            rate = current_count / elapsed if elapsed > 0 else 0
-            
-            # Rate desde último log
-            interval_elapsed = (now - self.last_time).total_seconds()
-            interval_rate = (current_count - self.last_count) / interval_elapsed if interval_elapsed > 0 else 0
-            
-            # Estimativa de tempo restante
-            if rate > 0:
-                remaining_urls = total_target - current_count
-                eta_seconds = remaining_urls / rate
-                eta_formatted = f"{int(eta_seconds // 60)}m {int(eta_seconds % 60)}s"
-            else:
-                eta_formatted = "N/A"
-            
-            # Percentual
-            percentage = (current_count / total_target * 100) if total_target > 0 else 0
-            
-            # Log com informações extras
-            self.logger.info(
-                f"📊 Progresso: {current_count:,}/{total_target:,} URLs ({percentage:.1f}%) | "
-                f"Queue: {queue_size:,} | Rate: {rate:.1f} URLs/s (atual: {interval_rate:.1f}) | "
-                f"ETA: {eta_formatted}",
-                extra={'url_count': current_count, 'rate': rate}
-            )
-            
-            self.last_count = current_count
-            self.last_time = now
+        # Fora do intervalo: uma comparação de inteiros e retorna
+        if current_count < self._next_log_at:
+            return
+        
+        # Próximo log no próximo múltiplo do intervalo
+        self._next_log_at = (current_count // self.log_interval + 1) * self.log_interval
+        
+        # Sem handler para INFO: não vale calcular estatísticas nem montar a mensagem
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
+        now = time.monotonic()
+        
+        # Calcula estatísticas
+        elapsed = now - self.start_time
+        rate = current_count / elapsed if elapsed > 0 else 0
+        
+        # Rate desde último log
+        interval_elapsed = now - self.last_time
+        interval_rate = (current_count - self.last_count) / interval_elapsed if interval_elapsed > 0 else 0
+        
+        # Estimativa de tempo restante
+        if rate > 0:
+            remaining_urls = total_target - current_count
+            eta_seconds = remaining_urls / rate
+            eta_formatted = f"{int(eta_seconds // 60)}m {int(eta_seconds % 60)}s"
+        else:
+            eta_formatted = "N/A"
+        
+        # Percentual
+        percentage = (current_count / total_target * 100) if total_target > 0 else 0
+        
+        # Log com informações extras
+        self.logger.info(
+            f"📊 Progresso: {current_count:,}/{total_target:,} URLs ({percentage:.1f}%) | "
+            f"Queue: {queue_size:,} | Rate: {rate:.1f} URLs/s (atual: {interval_rate:.1f}) | "
+            f"ETA: {eta_formatted}",
+            extra={'url_count': current_count, 'rate': rate}
+        )
+        
+        self.last_count = current_count
+        self.last_time = now
     
     def log_final_stats(self, total_crawled: int, success_count: int, error_count: int):
         """Log de estatísticas finais"""
-        elapsed = (datetime.now() - self.start_time).total_seconds()
+        elapsed = time.monotonic() - self.start_time
         avg_rate = total_crawled / elapsed if elapsed > 0 else 0
         success_rate = (success_count / total_crawled * 100) if total_crawled > 0 else 0
         
@@ -209,26 +276,28 @@ class CrawlProgressLogger:
 
 # === CONTEXT MANAGERS ===
 
-class LogContext:
-    """Context manager para logs temporários"""
+@contextmanager
+def log_context(logger: logging.Logger, context_name: str):
+    """Context manager para logs temporários (sem custo de debug quando DEBUG está desligado)"""
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    start_time = time.monotonic()
     
-    def __init__(self, logger: logging.Logger, context_name: str):
-        self.logger = logger
-        self.context_name = context_name
-        self.start_time = None
+    if debug_enabled:
+        logger.debug(f"🔄 Iniciando {context_name}")
     
-    def __enter__(self):
-        self.start_time = datetime.now()
-        self.logger.debug(f"🔄 Iniciando {self.context_name}")
-        return self
+    try:
+        yield
+    except BaseException as e:
+        elapsed = time.monotonic() - start_time
+        logger.error(f"❌ {context_name} falhou em {elapsed:.2f}s: {e}")
+        raise
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        elapsed = (datetime.now() - self.start_time).total_seconds()
-        
-        if exc_type is None:
-            self.logger.debug(f"✅ {self.context_name} concluído em {elapsed:.2f}s")
-        else:
-            self.logger.error(f"❌ {self.context_name} falhou em {elapsed:.2f}s: {exc_val}")
+    if debug_enabled:
+        elapsed = time.monotonic() - start_time
+        logger.debug(f"✅ {context_name} concluído em {elapsed:.2f}s")
+
+# Compatibilidade: with LogContext(logger, 'nome'): ...
+LogContext = log_context
 
 # === DECORATORS ===
 
@@ -236,16 +305,16 @@ def log_execution_time(logger: Optional[logging.Logger] = None):
     """Decorator para logar tempo de execução de funções"""
     def decorator(func):
         def wrapper(*args, **kwargs):
-            start_time = datetime.now()
+            start_time = time.monotonic()
             func_logger = logger or get_logger(func.__module__)
             
             try:
                 result = func(*args, **kwargs)
-                elapsed = (datetime.now() - start_time).total_seconds()
+                elapsed = time.monotonic() - start_time
                 func_logger.debug(f"⚡ {func.__name__} executado em {elapsed:.3f}s")
                 return result
             except Exception as e:
-                elapsed = (datetime.now() - start_time).total_seconds()
+                elapsed = time.monotonic() - start_time
                 func_logger.error(f"❌ {func.__name__} falhou em {elapsed:.3f}s: {e}")
                 raise
         
@@ -6,12 +6,49 @@ Resolve inconsistências em redirects, comparações e duplicatas
 
 import re
 import urllib.parse as urlparse
-from typing import Optional, Set, Dict, Any
+from functools import lru_cache
+from typing import Optional, Set, Dict, Any, Iterable, List
 from urllib.parse import unquote, quote
 import idna  # Para domínios internacionais
 
 from seofrog.utils.logger import get_logger
 
+# Padrões usados em toda normalização (compilados uma única vez)
+_CTRL_TABLE = dict.fromkeys([*range(0x00, 0x20), 0x7f])  # str.translate: remove caracteres de controle
+_MULTI_SLASH_RE = re.compile(r'/+')
+
+# Query só com chave=valor "seguros" (nada que parse_qsl decodifique ou urlencode codifique)
+_SIMPLE_QUERY_RE = re.compile(r'[\w.~-]*(?:=[\w.~-]*)?(?:&[\w.~-]*(?:=[\w.~-]*)?)*\Z', re.ASCII)
+
+# URL que a normalização devolveria intacta: https, host ASCII minúsculo sem porta,
+# path com segmentos não vazios e sem barra final (exceto a raiz), sem ;, %, query ou fragment
+_NORMALIZED_URL_RE = re.compile(
+    r"https://[a-z0-9._-]+(?:/(?:[A-Za-z0-9._~:@!$&'()*+,=-]+/)*[A-Za-z0-9._~:@!$&'()*+,=-]+|/)\Z"
+)
+
+# Parâmetros importantes a preservar (preserve_utm_params=True)
+_IMPORTANT_PARAMS = frozenset({
+    # UTM parameters
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    # Social media
+    'fbclid', 'gclid', 'msclkid', 'twclid',
+    # E-commerce
+    'ref', 'affiliate_id', 'partner_id',
+    # Tracking
+    'source', 'medium', 'campaign'
+})
+
+@lru_cache(maxsize=1024)
+def _encode_idn_host(host: str) -> str:
+    """
+    Converte host internacional (IDN) para ASCII/punycode
+    Se a conversão falhar, mantém o host original
+    """
+    try:
+        return idna.encode(host).decode('ascii')
+    except (idna.core.IDNAError, UnicodeError):
+        return host
+
 class URLNormalizer:
     """
     Normalizador de URLs enterprise com configurações flexíveis
@@ -46,21 +83,11 @@ class URLNormalizer:
         self.logger = get_logger('URLNormalizer')
         
         # Parâmetros importantes a preservar
-        self.important_params = {
-            # UTM parameters
-            'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
-            # Social media
-            'fbclid', 'gclid', 'msclkid', 'twclid',
-            # E-commerce
-            'ref', 'affiliate_id', 'partner_id',
-            # Tracking
-            'source', 'medium', 'campaign'
-        } if preserve_utm_params else set()
+        self.important_params = _IMPORTANT_PARAMS if preserve_utm_params else frozenset()
         
-        # Cache para URLs já normalizadas (performance)
-        self._cache = {}
-        self._cache_hits = 0
-        self._cache_misses = 0
+        # Cache LRU para URLs já normalizadas (performance), chave (url, strict)
+        self.cache_size = 200_000
+        self._cached_normalize = lru_cache(maxsize=self.cache_size)(self._normalize_impl)
     
     def normalize(self, url: str, strict: bool = True) -> str:
         """
@@ -81,13 +108,13 @@ class URLNormalizer:
         if not url or not isinstance(url, str):
             return ""
         
-        # Cache lookup para performance
-        cache_key = f"{url}|{strict}"
-        if cache_key in self._cache:
-            self._cache_hits += 1
-            return self._cache[cache_key]
-        
-        self._cache_misses += 1
+        return self._cached_normalize(url, strict)
+    
+    def _normalize_impl(self, url: str, strict: bool) -> str:
+        """Normalização efetiva (chamada só em cache miss)"""
+        # Fast path: URL já no formato normalizado, nada a parsear
+        if _NORMALIZED_URL_RE.match(url):
+            return url
         
         try:
             # Etapa 1: Limpeza inicial
@@ -104,21 +131,22 @@ class URLNormalizer:
             fragment = self._normalize_fragment(parsed.fragment, strict)
             
             # Etapa 4: Reconstrução
-            normalized_url = urlparse.urlunparse((
-                scheme, netloc, path, parsed.params, query, fragment
-            ))
-            
-            # Cache resultado
-            self._cache[cache_key] = normalized_url
+            if netloc and not parsed.params and not fragment and path.startswith('/'):
+                # Caso comum: concatenação direta (mesmo resultado do urlunparse)
+                normalized_url = scheme + '://' + netloc + path + ('?' + query if query else '')
+            else:
+                normalized_url = urlparse.urlunparse((
+                    scheme, netloc, path, parsed.params, query, fragment
+                ))
             
             # Log debug se mudou significativamente
             if url != normalized_url:
-                self.logger.debug(f"URL normalizada: {url} → {normalized_url}")
+                self.logger.debug("URL normalizada: %s → %s", url, normalized_url)
             
             return normalized_url
             
         except Exception as e:
-            self.logger.warning(f"Erro normalizando URL '{url}': {e}")
+            self.logger.warning("Erro normalizando URL '%s': %s", url, e)
             return url  # Retorna original em caso de erro
     
     def _initial_cleanup(self, url: str) -> str:
@@ -127,7 +155,7 @@ class URLNormalizer:
         url = url.strip()
         
         # Remove caracteres de controle
-        url = re.sub(r'[\x00-\x1f\x7f]', '', url)
+        url = url.translate(_CTRL_TABLE)
         
         # Adiciona scheme se ausente
         if not url.startswith(('http://', 'https://', '//')):
@@ -163,12 +191,9 @@ class URLNormalizer:
         if self.lowercase_domain:
             host = host.lower()
         
-        # Normaliza domínios internacionais (IDN)
-        try:
-            host = idna.encode(host).decode('ascii')
-        except (idna.core.IDNAError, UnicodeError):
-            # Se falhar, mantém original
-            pass
+        # Normaliza domínios internacionais (IDN); host ASCII já sai como está do idna
+        if not host.isascii():
+            host = _encode_idn_host(host)
         
         # Remove portas padrão
         if self.remove_default_ports and port:
@@ -192,7 +217,7 @@ class URLNormalizer:
             path = urlparse.urlunparse(('', '', path, '', '', '')).split('?')[0]
             
             # Remove // duplicados
-            path = re.sub(r'/+', '/', path)
+            path = _MULTI_SLASH_RE.sub('/', path)
             
             # Decode e re-encode para normalizar encoding
             try:
@@ -211,15 +236,31 @@ class URLNormalizer:
         if not query:
             return ''
         
+        # Vazio = preserva todos os parâmetros (key.lower() nem é chamado)
+        important_params = self.important_params
+        
+        # Caminho rápido: sem nada a decodificar/codificar, split manual equivale a parse_qsl + urlencode
+        if _SIMPLE_QUERY_RE.match(query):
+            clean_params = []
+            for pair in query.split('&'):
+                key, sep, value = pair.partition('=')
+                if not sep or not value:
+                    continue
+                if important_params and key.lower() not in important_params:
+                    continue
+                clean_params.append((key, value))
+            clean_params.sort()  # Ordem consistente
+            return '&'.join([f"{key}={value}" for key, value in clean_params])
+        
         try:
             # Parse parâmetros
             params = urlparse.parse_qsl(query, keep_blank_values=False)
             
             # Filtra parâmetros importantes se configurado
-            if self.important_params:
+            if important_params:
                 filtered_params = [
                     (key, value) for key, value in params 
-                    if key.lower() in self.important_params
+                    if key.lower() in important_params
                 ]
             else:
                 filtered_params = params
@@ -238,7 +279,7 @@ class URLNormalizer:
                 return ''
                 
         except Exception as e:
-            self.logger.debug(f"Erro normalizando query '{query}': {e}")
+            self.logger.debug("Erro normalizando query '%s': %s", query, e)
             return query
     
     def _normalize_fragment(self, fragment: str, strict: bool) -> str:
@@ -246,6 +287,35 @@ class URLNormalizer:
         # Por padrão, remove fragments para SEO (não afetam server-side)
         return ''
     
+    def normalize_many(self, urls: Iterable[str], strict: bool = True) -> List[str]:
+        """
+        Normaliza um lote de URLs (mesma ordem da entrada)
+        URLs repetidas no lote são normalizadas uma única vez
+        
+        Args:
+            urls: URLs para normalizar
+            strict: Se True, aplica todas as regras. Se False, mais permissivo
+            
+        Returns:
+            List[str]: URLs normalizadas
+        """
+        cached_normalize = self._cached_normalize
+        seen = {}
+        normalized_urls = []
+        append = normalized_urls.append
+        
+        for url in urls:
+            if not url or not isinstance(url, str):
+                append("")
+                continue
+            
+            normalized = seen.get(url)
+            if normalized is None:
+                normalized = seen[url] = cached_normalize(url, strict)
+            append(normalized)
+        
+        return normalized_urls
+    
     def are_equivalent(self, url1: str, url2: str) -> bool:
         """
         Verifica se duas URLs são equivalentes após normalização
@@ -271,22 +341,21 @@ class URLNormalizer:
         Returns:
             Dict com hits, misses, hit_rate, cache_size
         """
-        total = self._cache_hits + self._cache_misses
-        hit_rate = (self._cache_hits / total * 100) if total > 0 else 0
+        info = self._cached_normalize.cache_info()
+        total = info.hits + info.misses
+        hit_rate = (info.hits / total * 100) if total > 0 else 0
         
         return {
-            'cache_hits': self._cache_hits,
-            'cache_misses': self._cache_misses, 
+            'cache_hits': info.hits,
+            'cache_misses': info.misses, 
             'hit_rate_percent': round(hit_rate, 2),
-            'cache_size': len(self._cache),
+            'cache_size': info.currsize,
             'total_normalizations': total
         }
     
     def clear_cache(self):
         """Limpa o cache de URLs normalizadas"""
-        self._cache.clear()
-        self._cache_hits = 0
-        self._cache_misses = 0
+        self._cached_normalize.cache_clear()
         self.logger.debug("Cache de URLs limpo")
 
 
@@ -340,8 +409,9 @@ def create_permissive_normalizer() -> URLNormalizer:
 # FUNÇÕES DE CONVENIÊNCIA
 # ==========================================
 
-# Instância global padrão (thread-safe)
-_default_normalizer = None
+# Instâncias globais padrão, criadas na carga do módulo (thread-safe)
+_SEO_NORMALIZER = create_seo_normalizer()
+_STRICT_NORMALIZER = create_strict_normalizer()
 
 def normalize_url(url: str, strict: bool = False) -> str:
     """
@@ -359,12 +429,8 @@ def normalize_url(url: str, strict: bool = False) -> str:
         >>> normalize_url("HTTP://Site.com/page/?ref=abc")
         'https://site.com/page?ref=abc'
     """
-    global _default_normalizer
-    
-    if _default_normalizer is None:
-        _default_normalizer = create_strict_normalizer() if strict else create_seo_normalizer()
-    
-    return _default_normalizer.normalize(url, strict=strict)
+    normalizer = _STRICT_NORMALIZER if strict else _SEO_NORMALIZER
+    return normalizer.normalize(url, strict=strict)
 
 def urls_are_equivalent(url1: str, url2: str) -> bool:
     """
@@ -374,12 +440,7 @@ def urls_are_equivalent(url1: str, url2: str) -> bool:
         >>> urls_are_equivalent("http://site.com/page/", "https://SITE.com/page")
         True
     """
-    global _default_normalizer
-    
-    if _default_normalizer is None:
-        _default_normalizer = create_seo_normalizer()
-    
-    return _default_normalizer.are_equivalent(url1, url2)
+    return _SEO_NORMALIZER.are_equivalent(url1, url2)
 
 # ==========================================
 # TESTES INTEGRADOS
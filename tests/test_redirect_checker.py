@@ -0,0 +1,133 @@
+"""
+tests/test_redirect_checker.py
+Regressões da verificação de redirects em lote (RedirectChecker + crawler)
+"""
+
+import importlib.util
+import threading
+import unittest
+
+from seofrog.parsers.technical_parser import TechnicalParser, RedirectChecker
+
+# O crawler importa psutil, chardet e pandas (exportação CSV)
+CRAWLER_AVAILABLE = all(importlib.util.find_spec(mod) for mod in ('psutil', 'chardet', 'pandas'))
+
+DEFAULT_REDIRECT_FIELDS = {
+    'redirects_found': [],
+    'redirects_count': 0,
+    'redirects_by_code': {},
+    'redirects_errors': []
+}
+
+
+def _stub_parser(redirects=None):
+    """TechnicalParser com _head_redirect trocado por um stub que registra as chamadas"""
+    parser = TechnicalParser()
+    parser.redirect_delay = 0
+    parser.calls = []
+    lock = threading.Lock()
+    redirects = redirects or {}
+
+    def head_redirect(url):
+        with lock:
+            parser.calls.append(url)
+        return redirects.get(url, url), 200, None
+
+    parser._head_redirect = head_redirect
+    return parser
+
+
+class TestRedirectChecker(unittest.TestCase):
+
+    def test_links_are_checked_once_across_pages(self):
+        parser = _stub_parser({'https://example.com/b': 'https://example.com/b2'})
+        pages = {
+            'https://example.com/p1': ['https://example.com/a', 'https://example.com/b'],
+            'https://example.com/p2': ['https://example.com/b', 'https://example.com/c'],
+        }
+        checker = RedirectChecker(parser, max_workers=4)
+
+        results = checker.run(pages)
+
+        self.assertEqual(sorted(parser.calls), ['https://example.com/a', 'https://example.com/b', 'https://example.com/c'])
+        self.assertEqual(set(results), {'https://example.com/a', 'https://example.com/b', 'https://example.com/c'})
+
+        redirect_data = checker.apply(pages, results)
+        for page_url in pages:
+            self.assertEqual(redirect_data[page_url]['redirects_count'], 1)
+            self.assertEqual(redirect_data[page_url]['redirects_found'][0]['source_url'], page_url)
+
+    def test_should_stop_before_start_checks_nothing(self):
+        parser = _stub_parser()
+        checker = RedirectChecker(parser, should_stop=lambda: True)
+
+        self.assertEqual(checker.run({'https://example.com/p': ['https://example.com/a']}), {})
+        self.assertEqual(parser.calls, [])
+
+    def test_should_stop_during_run_cancels_pending_links(self):
+        parser = _stub_parser()
+        links = [f'https://example.com/{i}' for i in range(50)]
+        checker = RedirectChecker(parser, max_workers=1, should_stop=lambda: bool(parser.calls))
+
+        results = checker.run({'https://example.com/p': links})
+
+        self.assertGreaterEqual(len(results), 1)
+        self.assertLess(len(parser.calls), len(links))
+
+    def test_pages_without_links_or_results_get_defaults(self):
+        parser = _stub_parser()
+        checker = RedirectChecker(parser)
+        pages = {
+            'https://example.com/empty': [],
+            'https://example.com/unchecked': ['https://example.com/a'],
+        }
+
+        redirect_data = checker.apply(pages, {})
+
+        for page_url in pages:
+            self.assertEqual(redirect_data[page_url], DEFAULT_REDIRECT_FIELDS)
+
+
+@unittest.skipUnless(CRAWLER_AVAILABLE, 'crawler requer psutil, chardet e pandas')
+class TestCrawlerRedirectDefaults(unittest.TestCase):
+
+    def _crawler(self, should_stop):
+        from seofrog.core.crawler import SEOFrog
+        from seofrog.utils.logger import get_logger
+
+        # Só o estado usado por _check_internal_redirects (sem HTTPEngine/sinais)
+        crawler = SEOFrog.__new__(SEOFrog)
+        crawler.logger = get_logger('SEOFrog')
+        crawler.technical_parser = _stub_parser()
+        crawler.config = type('Config', (), {'max_workers': 2})()
+        crawler.should_stop = should_stop
+        crawler.results = [{'url': 'https://example.com/p1'}, {'url': 'https://example.com/p2'}]
+        crawler._redirect_check_pages = {
+            'https://example.com/p1': ('https://example.com/a',),
+            'https://example.com/p2': (),
+        }
+        crawler._redirect_link_pool = {}
+        return crawler
+
+    def test_interrupted_crawl_sets_default_fields(self):
+        crawler = self._crawler(should_stop=True)
+
+        crawler._check_internal_redirects()
+
+        self.assertEqual(crawler.technical_parser.calls, [])
+        for result in crawler.results:
+            for key, value in DEFAULT_REDIRECT_FIELDS.items():
+                self.assertEqual(result[key], value)
+
+    def test_page_without_links_gets_default_fields(self):
+        crawler = self._crawler(should_stop=False)
+
+        crawler._check_internal_redirects()
+
+        self.assertEqual(crawler.technical_parser.calls, ['https://example.com/a'])
+        self.assertEqual(crawler.results[1]['redirects_count'], 0)
+        self.assertEqual(crawler.results[1]['redirects_found'], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
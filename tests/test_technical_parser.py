@@ -0,0 +1,185 @@
+"""
+tests/test_technical_parser.py
+Regressões do TechnicalParser: links internos, estrutura HTML, tags fora do <head>,
+viewport e cache de redirects
+"""
+
+import unittest
+
+from bs4 import BeautifulSoup
+
+from seofrog.parsers.technical_parser import TechnicalParser
+
+BASE_URL = 'https://example.com/page'
+
+ANCHORS_HTML = b"""<html><head><title>T</title></head><body>
+<a href="/real" data-href="/fake">real</a>
+<a href=/unquoted>unquoted</a>
+<!-- <a href="/commented">commented</a> -->
+<script>document.write('<a href="/inscript">x</a>');</script>
+<a href="/ok">ok</a>
+</body></html>"""
+
+
+class TestInternalLinks(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = TechnicalParser()
+
+    def test_links_ignore_data_href_comments_and_scripts(self):
+        data = self.parser.parse(BeautifulSoup(ANCHORS_HTML, 'lxml'), BASE_URL)
+
+        self.assertEqual(data['_internal_links_for_redirect_check'], [
+            'https://example.com/real',
+            'https://example.com/unquoted',
+            'https://example.com/ok',
+        ])
+
+    def test_links_same_from_parse_html(self):
+        from_soup = self.parser.parse(BeautifulSoup(ANCHORS_HTML, 'lxml'), BASE_URL)
+        from_html = self.parser.parse_html(ANCHORS_HTML, BASE_URL)
+
+        self.assertEqual(from_soup['_internal_links_for_redirect_check'],
+                         from_html['_internal_links_for_redirect_check'])
+
+
+class TestHtmlStructure(unittest.TestCase):
+
+    # HTML5 válido com <html>/<head>/<body> omitidos
+    OMITTED_TAGS_HTML = b'<!DOCTYPE html><title>T</title><meta charset=utf-8><p>hi'
+
+    def setUp(self):
+        self.parser = TechnicalParser()
+
+    def test_omitted_optional_tags_are_valid(self):
+        data = self.parser.parse_html(self.OMITTED_TAGS_HTML, BASE_URL)
+
+        self.assertTrue(data['html_structure_valid'])
+        self.assertEqual(data['html_structure_score'], 100)
+        self.assertNotIn('estrutura_html_invalida', data['technical_issues'])
+
+    def test_structure_same_from_soup_and_parse_html(self):
+        from_soup = self.parser.parse(BeautifulSoup(self.OMITTED_TAGS_HTML, 'lxml'), BASE_URL)
+        from_html = self.parser.parse_html(self.OMITTED_TAGS_HTML, BASE_URL)
+
+        for key in ('html_structure_score', 'technical_quality_score', 'technical_issues'):
+            self.assertEqual(from_soup[key], from_html[key])
+
+
+class TestBodyLevelTags(unittest.TestCase):
+
+    # meta/link no body (CMS) e head fechado cedo pelo lxml por causa do <p>
+    BODY_META_HTML = b"""<!DOCTYPE html><html><head><title>T</title></head><body>
+<meta name="robots" content="noindex">
+<p>texto</p>
+</body></html>"""
+    EARLY_HEAD_CLOSE_HTML = b"""<!DOCTYPE html><html><head><title>T</title><p>oops</p>
+<meta charset="utf-8"><link rel="icon" href="/favicon.ico">
+</head><body></body></html>"""
+    BODY_CONSUMERS_HTML = b"""<!DOCTYPE html><html><head><title>T</title></head><body>
+<meta http-equiv="refresh" content="5; url=/x"><meta name="referrer" content="no-referrer">
+<link rel="amphtml" href="/amp"><link rel="preload" href="/a.js">
+</body></html>"""
+
+    def setUp(self):
+        self.parser = TechnicalParser()
+
+    def test_body_level_robots_noindex(self):
+        data = self.parser.parse_html(self.BODY_META_HTML, BASE_URL)
+
+        self.assertEqual(data['meta_robots'], 'noindex')
+        self.assertFalse(data['robots_allows_indexing'])
+
+    def test_tags_after_early_head_close(self):
+        soup = BeautifulSoup(self.EARLY_HEAD_CLOSE_HTML, 'lxml')
+        self.assertIsNone(soup.head.find('meta'))
+
+        data = self.parser.parse(soup, BASE_URL)
+
+        self.assertTrue(data['has_charset'])
+        self.assertTrue(data['has_favicon'])
+
+    def test_every_consumer_sees_body_level_tags(self):
+        data = self.parser.parse_html(self.BODY_CONSUMERS_HTML, BASE_URL)
+
+        self.assertTrue(data['has_meta_refresh'])
+        self.assertTrue(data['has_referrer_policy'])
+        self.assertTrue(data['has_amp_canonical'])
+        self.assertTrue(data['uses_preload'])
+
+
+class TestViewport(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = TechnicalParser()
+
+    def _analyze(self, content):
+        data = {}
+        self.parser._analyze_viewport_content(content, data)
+        return data
+
+    def test_bare_initial_scale_counts_as_declared(self):
+        data = self._analyze('width=device-width, initial-scale')
+
+        self.assertTrue(data['viewport_has_initial_scale'])
+        self.assertEqual(data['viewport_mobile_score'], 80)
+
+    def test_first_repeated_directive_wins(self):
+        data = self._analyze('width=device-width, initial-scale=1, initial-scale=0.5')
+
+        self.assertEqual(data['viewport_initial_scale'], 1.0)
+        self.assertEqual(data['viewport_issues'], [])
+        self.assertEqual(data['viewport_mobile_score'], 100)
+
+
+class TestRedirectCache(unittest.TestCase):
+
+    def setUp(self):
+        self.parser = TechnicalParser()
+        self.calls = []
+        self.responses = {}
+
+        # _head_redirect sem rede: devolve a resposta configurada por URL
+        def head_redirect(url):
+            self.calls.append(url)
+            return self.responses.get(url, (url, 200, None))
+
+        self.parser._head_redirect = head_redirect
+
+    def test_errors_are_retried(self):
+        url = 'https://example.com/slow'
+        self.responses[url] = (url, None, 'Read timed out')
+        first = self.parser._check_single_redirect(url)
+
+        self.responses[url] = ('https://example.com/new', 200, None)
+        second = self.parser._check_single_redirect(url)
+
+        self.assertEqual(first['error'], 'Read timed out')
+        self.assertTrue(second['has_redirect'])
+        self.assertEqual(self.calls, [url, url])
+
+    def test_status_results_are_cached(self):
+        url = 'https://example.com/old'
+        self.responses[url] = ('https://example.com/new', 200, None)
+
+        first = self.parser._check_single_redirect(url)
+        second = self.parser._check_single_redirect(url)
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.calls, [url])
+
+    def test_least_recently_used_is_evicted_at_capacity(self):
+        self.parser.redirect_cache_size = 2
+        a, b, c = ('https://example.com/a', 'https://example.com/b', 'https://example.com/c')
+
+        for url in (a, b, a, c):  # a volta ao fim da fila; c entra e b sai
+            self.parser._check_single_redirect(url)
+        self.assertEqual(list(self.parser._redirect_cache), [a, c])
+
+        self.parser._check_single_redirect(b)
+        self.parser._check_single_redirect(c)
+        self.assertEqual(self.calls, [a, b, c, b])
+
+
+if __name__ == '__main__':
+    unittest.main()
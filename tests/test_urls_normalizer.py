@@ -0,0 +1,57 @@
+"""
+tests/test_urls_normalizer.py
+Caminhos rápidos do URLNormalizer (URL já normalizada, query simples) x caminho completo
+"""
+
+import re
+import unittest
+from unittest import mock
+
+from seofrog.utils import urls_normalizer
+from seofrog.utils.urls_normalizer import create_seo_normalizer, create_strict_normalizer
+
+# (caso, URL, resultado esperado com o normalizador SEO)
+CASES = (
+    ('host maiúsculo', 'https://EXAMPLE.com/page', 'https://example.com/page'),
+    ('porta padrão', 'https://example.com:443/page', 'https://example.com/page'),
+    ('%-escape no path', 'https://example.com/caf%C3%A9', 'https://example.com/caf%C3%A9'),
+    ('%-escape na query', 'https://example.com/p?utm_source=a%20b', 'https://example.com/p?utm_source=a+b'),
+    ('parâmetro de tracking', 'https://example.com/p?utm_source=google&junk=1', 'https://example.com/p?utm_source=google'),
+    ('query fora de ordem', 'https://example.com/p?utm_medium=x&utm_source=y', 'https://example.com/p?utm_medium=x&utm_source=y'),
+    ('parâmetro vazio', 'https://example.com/p?utm_source=&ref=a', 'https://example.com/p?ref=a'),
+    ('host IDN', 'https://bücher.example/p', 'https://xn--bcher-kva.example/p'),
+    ('? final', 'https://example.com/p?', 'https://example.com/p'),
+    ('já normalizada', 'https://example.com/p', 'https://example.com/p'),
+    ('raiz', 'https://example.com/', 'https://example.com/'),
+)
+
+# Regex que nunca casa: desliga os caminhos rápidos
+_NEVER = re.compile(r'(?!)')
+
+
+def _slow_normalize(normalizer, url, strict):
+    """Normaliza pelo caminho completo (urlparse + parse_qsl/urlencode), sem cache"""
+    with mock.patch.object(urls_normalizer, '_NORMALIZED_URL_RE', _NEVER), \
+         mock.patch.object(urls_normalizer, '_SIMPLE_QUERY_RE', _NEVER):
+        return normalizer._normalize_impl(url, strict)
+
+
+class TestFastPathEquivalence(unittest.TestCase):
+
+    def test_seo_results(self):
+        normalizer = create_seo_normalizer()
+
+        for label, url, expected in CASES:
+            with self.subTest(label):
+                self.assertEqual(normalizer.normalize(url, strict=False), expected)
+
+    def test_fast_path_matches_full_path(self):
+        for strict, normalizer in ((False, create_seo_normalizer()), (True, create_strict_normalizer())):
+            for label, url, _ in CASES:
+                with self.subTest(label, strict=strict):
+                    self.assertEqual(normalizer._normalize_impl(url, strict),
+                                     _slow_normalize(normalizer, url, strict))
+
+
+if __name__ == '__main__':
+    unittest.main()